@@ -35,6 +35,8 @@ EXTERNAL_WEATHER_UPDATE_INTERVAL_MINUTES = 30  # HA weather entities update ~30
 WIND_AVERAGE_WINDOW_MINUTES = 10  # Rolling window for vector wind average
 VERIFICATION_WINDOW_H = 12  # Hours between forecast snapshot and retrospective check
 VERIFICATION_HISTORY_MAX = 10  # Maximum verification history entries to retain
+CALIBRATION_SAVE_DELAY_SECONDS = 300  # Coalesce sky calibration writes to storage
+CALIBRATION_SAVE_MIN_DELTA = 1e-4  # Smaller factor changes are not persisted
 
 # Cache Settings
 CACHE_DURATION_MINUTES = 5
@@ -2,21 +2,27 @@
 
 from __future__ import annotations
 
-import contextlib
+import asyncio
+import bisect
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+import functools
 import logging
 import math
-from typing import Any
+import time
+from typing import Any, TypeIs
 
 from homeassistant.components.recorder import get_instance
 from homeassistant.components.recorder.history import state_changes_during_period
-from homeassistant.core import HomeAssistant, State
+from homeassistant.core import HomeAssistant, State, callback
 from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
 
 from .const import (
     ALGORITHM_WINDOW_HOURS,
+    CALIBRATION_SAVE_DELAY_SECONDS,
+    CALIBRATION_SAVE_MIN_DELTA,
     CLOUD_COVER_MAX,
     CLOUD_COVER_MIN,
     CLOUD_LEVEL_CLEAR,
@@ -95,18 +101,150 @@ from .const import (
     ZONE_DIRECTIONS_ST,
 )
 from .ha_weather import ExternalWeatherData, HAWeatherClient
-from .sager_table import SAGER_TABLE
+from .sager_table import SAGER_TABLE_INDEXED, sager_table_index
 
 _LOGGER = logging.getLogger(__name__)
 
 
-def _is_valid_float(value: str) -> bool:
-    """Return True if *value* can be converted to a float."""
-    try:
-        float(value)
-    except (ValueError, TypeError):
-        return False
-    return True
+def _is_valid_state(state: State | None) -> TypeIs[State]:
+    """Return True if a state exists and carries a usable (non-sentinel) value."""
+    return state is not None and state.state not in _INVALID_STATES
+
+
+def _time_weighted_readings(
+    states: list[State],
+    start: datetime,
+    end: datetime,
+    min_val: float,
+    max_val: float,
+) -> list[tuple[float, float]]:
+    """Return (value, seconds in effect) for each valid reading in [start, end].
+
+    *states* are in chronological order and may begin with the recorder's
+    start-time state; each reading holds from its last_changed (clipped to
+    *start*) until the next state change, or *end* for the newest one.
+    Invalid or out-of-range states still end the preceding reading.
+    """
+    readings: list[tuple[float, float]] = []
+    for idx, state in enumerate(states):
+        if state.state in _INVALID_STATES:
+            continue
+        try:
+            value = float(state.state)
+        except (ValueError, TypeError):
+            continue
+        if not min_val <= value <= max_val:
+            continue
+        held_from = max(state.last_changed, start)
+        held_until = states[idx + 1].last_changed if idx + 1 < len(states) else end
+        seconds = (min(held_until, end) - held_from).total_seconds()
+        if seconds > 0:
+            readings.append((value, seconds))
+    return readings
+
+
+# Magnus-form saturation vapor pressure constants (Alduchov & Eskridge 1996):
+# e_s(T) = A × exp(B × T / (T + C)) with T in °C and e_s in hPa.
+_MAGNUS_A = 6.112
+_MAGNUS_B = 17.67
+_MAGNUS_C = 243.5
+
+
+def _magnus_vapor_pressure(t_celsius: float) -> float:
+    """Return the saturation vapor pressure (hPa) at *t_celsius*."""
+    return _MAGNUS_A * math.exp(_MAGNUS_B * t_celsius / (t_celsius + _MAGNUS_C))
+
+
+@functools.lru_cache(maxsize=8)
+def _ineichen_altitude_factors(
+    altitude_m: float,
+) -> tuple[float, float, float, float]:
+    """Return the Ineichen-Perez altitude terms (fh1, fh2, cg1, cg2) for a site."""
+    fh1 = math.exp(-altitude_m / 8000.0)  # altitude factor 1 (Rayleigh)
+    fh2 = math.exp(-altitude_m / 1250.0)  # altitude factor 2 (aerosol)
+    cg1 = 5.09e-5 * altitude_m + 0.868  # model constant 1
+    cg2 = 3.92e-5 * altitude_m + 0.0387  # model constant 2
+    return fh1, fh2, cg1, cg2
+
+
+def _solar_geometry(elevation: float) -> tuple[float, float]:
+    """Return (cos_zenith, relative airmass) for a sun elevation in degrees.
+
+    Kasten & Young (1989) relative airmass; pressure correction is applied by
+    the caller.
+    """
+    cos_zenith = math.cos(math.radians(90.0 - elevation))
+    sin_elev = math.sin(math.radians(elevation))
+    scaled = 614.0 * sin_elev
+    airmass_rel = math.sqrt(1229.0 + scaled * scaled) - scaled
+    return cos_zenith, airmass_rel
+
+
+@functools.lru_cache(maxsize=8)
+def _solar_day_terms(doy: int, latitude: float) -> tuple[float, float]:
+    """Return (Earth-Sun distance factor, solar noon elevation °) for a day.
+
+    Earth-Sun distance correction: orbital eccentricity causes the
+    extraterrestrial irradiance to vary ±3.3% through the year (perihelion
+    ~Jan 3: +3.3%; aphelion ~Jul 4: −3.3%).  Spencer (1971) approximation,
+    accurate to ±0.01%.
+
+    Noon elevation uses the simplified Spencer (1971) solar declination.
+    """
+    earth_sun_factor = 1.0 + 0.033 * math.cos(2.0 * math.pi * doy / 365.0)
+    decl = math.radians(
+        23.45 * math.sin(math.radians(360.0 / 365.0 * (doy - 81.0)))
+    )
+    lat_rad = math.radians(latitude)
+    noon_elev_sin = (
+        math.sin(lat_rad) * math.sin(decl)
+        + math.cos(lat_rad) * math.cos(decl)
+    )
+    noon_elevation = math.degrees(math.asin(max(-1.0, min(1.0, noon_elev_sin))))
+    return earth_sun_factor, noon_elevation
+
+
+@functools.lru_cache(maxsize=512)
+def _decode_sager_value(value: str) -> tuple[str, str, str, str | None]:
+    """Decode a Sager table value into its forecast code and wind keys.
+
+    Value format: forecast_letter + velocity_letter + direction_digit(s).
+    Returns (forecast code, wind velocity key, wind direction key, optional
+    second wind direction key).  The table holds a few hundred distinct
+    values, so each one is parsed once and every later lookup is a cache hit.
+    """
+    # Velocity letter → key (N=increasing, U=unchanged, D=decreasing, etc.)
+    wind_vel_idx = VELOCITY_LETTER_TO_INDEX.get(value[1], 7)
+    wind_velocity_key = (
+        WIND_VELOCITY_KEYS[wind_vel_idx]
+        if wind_vel_idx < _WIND_VEL_KEYS_LEN
+        else "no_significant_change"
+    )
+
+    # Direction digit 1-9 → index 0-8 in WIND_DIRECTION_KEYS
+    dir1_idx = int(value[2]) - 1
+    wind_direction_key = (
+        WIND_DIRECTION_KEYS[dir1_idx]
+        if 0 <= dir1_idx < _WIND_DIR_KEYS_LEN
+        else "variable"
+    )
+
+    # Optional second direction (transition forecast)
+    wind_direction_key2: str | None = None
+    if len(value) == 4:
+        dir2_idx = int(value[3]) - 1
+        wind_direction_key2 = (
+            WIND_DIRECTION_KEYS[dir2_idx]
+            if 0 <= dir2_idx < _WIND_DIR_KEYS_LEN
+            else None
+        )
+
+    return (
+        value[0].lower(),
+        wind_velocity_key,
+        wind_direction_key,
+        wind_direction_key2,
+    )
 
 
 class _CalibrationStore(Store[dict[str, float]]):
@@ -142,9 +280,213 @@ _CLOUD_LEVEL_ORDINALS: dict[str, int] = {
     CLOUD_LEVEL_RAINING: 5,
 }
 
+# Config keys of every source sensor read during a refresh.
+_SENSOR_ENTITY_KEYS: tuple[str, ...] = (
+    CONF_PRESSURE_ENTITY,
+    CONF_WIND_DIR_ENTITY,
+    CONF_WIND_SPEED_ENTITY,
+    CONF_CLOUD_COVER_ENTITY,
+    CONF_RAINING_ENTITY,
+    CONF_TEMPERATURE_ENTITY,
+    CONF_HUMIDITY_ENTITY,
+    CONF_DEWPOINT_ENTITY,
+)
+
+# Numeric source sensors read with range validation, as
+# (config_key, data_key, default, min_val, max_val).
+_NUMERIC_SENSORS: tuple[tuple[str, str, float, float, float], ...] = (
+    (CONF_PRESSURE_ENTITY, "pressure", 1013.25, PRESSURE_MIN, PRESSURE_MAX),
+    (CONF_WIND_DIR_ENTITY, "wind_direction", 0, WIND_DIR_MIN, WIND_DIR_MAX),
+    (CONF_WIND_SPEED_ENTITY, "wind_speed", 0, WIND_SPEED_MIN, WIND_SPEED_MAX),
+)
+
+# Reliability inputs as (sensor_data key, weight); entity-based checks sum
+# to 60 pts.  Their status comes from _get_sensor_data().
+_CRITICAL_ENTITIES: tuple[tuple[str, int], ...] = (
+    ("pressure", 20),
+    ("wind_direction", 15),
+    ("wind_speed", 10),
+    ("cloud_cover", 15),
+)
+
+# Source of the solar elevation used by the clear-sky model.
+_SUN_ENTITY_ID = "sun.sun"
+
+# Entity states that carry no usable reading.
+_INVALID_STATES: frozenset[str] = frozenset({"unavailable", "unknown", "none"})
+
+# Binary rain sensor states that mean "raining".
+_TRUE_STATES: frozenset[str] = frozenset({"on", "true", "1"})
+
 # Forecast conditions that imply precipitation (used for rain-correct scoring).
 _RAIN_CONDITIONS: frozenset[str] = frozenset({"rainy", "snowy", "pouring"})
 
+# HPA_LEVELS are contiguous [min, max) bands; sorted by lower bound they give
+# the cutoffs for a bisect lookup.  The lowest band (-inf lower bound) needs
+# no cutoff: bisect index 0 already selects it.
+_HPA_LEVELS_ASCENDING = sorted(HPA_LEVELS, key=lambda band: band[1])
+_HPA_CUTOFFS: tuple[float, ...] = tuple(
+    min_hpa for _, min_hpa, _ in _HPA_LEVELS_ASCENDING[1:]
+)
+_HPA_LEVEL_BY_INDEX: tuple[int, ...] = tuple(
+    level for _, _, level in _HPA_LEVELS_ASCENDING
+)
+
+# Upper bounds (inclusive) of the pressure-trend and cloud-level bands.
+# bisect_left counts the thresholds strictly below the value, which keeps the
+# "value > threshold" comparisons of the original if-chains at exact edges.
+_PRESSURE_TREND_THRESHOLDS: tuple[float, ...] = (-1.4, -0.68, 0.68, 1.4)
+_CLOUD_LEVEL_THRESHOLDS: tuple[float, ...] = (20.0, 50.0, 80.0)
+
+# Display names indexed by the 1-based Sager input levels (level - 1).
+_TREND_NAMES: tuple[str, ...] = (
+    WIND_TREND_STEADY,
+    WIND_TREND_VEERING,
+    WIND_TREND_BACKING,
+)
+_PRESSURE_NAMES: tuple[str, ...] = (
+    PRESSURE_TREND_RISING_RAPIDLY,
+    PRESSURE_TREND_RISING_SLOWLY,
+    PRESSURE_TREND_NORMAL,
+    PRESSURE_TREND_DECREASING_SLOWLY,
+    PRESSURE_TREND_DECREASING_RAPIDLY,
+)
+_CLOUD_NAMES: tuple[str, ...] = (
+    CLOUD_LEVEL_CLEAR,
+    CLOUD_LEVEL_PARTLY_CLOUDY,
+    CLOUD_LEVEL_MOSTLY_CLOUDY,
+    CLOUD_LEVEL_OVERCAST,
+    CLOUD_LEVEL_RAINING,
+)
+_WIND_DIR_KEYS_LEN = len(WIND_DIRECTION_KEYS)
+_WIND_VEL_KEYS_LEN = len(WIND_VELOCITY_KEYS)
+
+# sin/cos of every whole degree.  Wind-vane sensors almost always report
+# integer degrees, so the circular mean can skip the libm calls per sample.
+_SIN_LUT: tuple[float, ...] = tuple(math.sin(math.radians(d)) for d in range(360))
+_COS_LUT: tuple[float, ...] = tuple(math.cos(math.radians(d)) for d in range(360))
+
+# 8-point compass in 45° sectors, clockwise from north.
+_WIND_CARDINALS: tuple[str, ...] = (
+    WIND_CARDINAL_N,
+    WIND_CARDINAL_NE,
+    WIND_CARDINAL_E,
+    WIND_CARDINAL_SE,
+    WIND_CARDINAL_S,
+    WIND_CARDINAL_SW,
+    WIND_CARDINAL_W,
+    WIND_CARDINAL_NW,
+)
+
+# Cardinal sector for every half-degree bucket (index = int(direction × 2)).
+# Sector edges fall at 22.5° + n×45°, which are whole half-degrees, so the
+# lookup matches int((direction + 22.5) / 45) % 8 exactly for any direction.
+_WIND_SECTOR_LUT: tuple[str, ...] = tuple(
+    _WIND_CARDINALS[(half_deg + 45) // 90 % 8] for half_deg in range(720)
+)
+
+
+# Latitude zone lower edges (ascending) for bisect_right, and the zone name and
+# wind direction array for each resulting index. Northern edges are inclusive
+# (lat >= edge) while southern edges are exclusive (lat > edge), hence the
+# nextafter() nudges.
+_ZONE_EDGES: tuple[float, ...] = (
+    math.nextafter(LATITUDE_SOUTHERN_POLAR, math.inf),
+    math.nextafter(LATITUDE_SOUTHERN_TROPIC, math.inf),
+    0.0,
+    LATITUDE_NORTHERN_TROPIC,
+    LATITUDE_NORTHERN_POLAR,
+)
+_ZONE_NAMES: tuple[str, ...] = (
+    "Southern Polar",
+    "Southern Temperate",
+    "Southern Tropical",
+    "Northern Tropical",
+    "Northern Temperate",
+    "Northern Polar",
+)
+_ZONE_DIRECTIONS: tuple[list[str], ...] = (
+    ZONE_DIRECTIONS_SP,  # Southern Polar
+    ZONE_DIRECTIONS_ST,  # Southern Temperate
+    ZONE_DIRECTIONS_SP,  # Southern Tropical
+    ZONE_DIRECTIONS_NP,  # Northern Tropical
+    ZONE_DIRECTIONS_NT,  # Northern Temperate (standard)
+    ZONE_DIRECTIONS_NP,  # Northern Polar
+)
+
+# Zambretti outcomes as flat per-trend tuples indexed by forecast number, and
+# the (lo, hi) forecast number range each trend's formula is clamped to.
+_ZAMBRETTI_SIZE = 1 + max(max(table) for table in ZAMBRETTI_FORECASTS.values())
+_Z_FALLING: tuple[tuple[str, str] | None, ...] = tuple(
+    ZAMBRETTI_FORECASTS["falling"].get(idx) for idx in range(_ZAMBRETTI_SIZE)
+)
+_Z_STEADY: tuple[tuple[str, str] | None, ...] = tuple(
+    ZAMBRETTI_FORECASTS["steady"].get(idx) for idx in range(_ZAMBRETTI_SIZE)
+)
+_Z_RISING: tuple[tuple[str, str] | None, ...] = tuple(
+    ZAMBRETTI_FORECASTS["rising"].get(idx) for idx in range(_ZAMBRETTI_SIZE)
+)
+_Z_FALLING_BOUNDS = (
+    min(ZAMBRETTI_FORECASTS["falling"]),
+    max(ZAMBRETTI_FORECASTS["falling"]),
+)
+_Z_STEADY_BOUNDS = (
+    min(ZAMBRETTI_FORECASTS["steady"]),
+    max(ZAMBRETTI_FORECASTS["steady"]),
+)
+_Z_RISING_BOUNDS = (
+    min(ZAMBRETTI_FORECASTS["rising"]),
+    max(ZAMBRETTI_FORECASTS["rising"]),
+)
+
+
+# Severity ranking used to compare Sager and Zambretti conditions.
+_SEVERITY: dict[str, int] = {
+    "sunny": 0,
+    "clear-night": 0,
+    "partlycloudy": 1,
+    "cloudy": 2,
+    "rainy": 3,
+    "snowy": 3,
+    "pouring": 4,
+}
+
+# Cross-validation outcome per severity difference (capped at 3):
+# (label, confidence delta, confidence floor, confidence ceiling).
+# Bounds stay within the 0-100 percentage so confidence remains an int.
+_CONF_ADJUST: tuple[tuple[str, int, int, int], ...] = (
+    ("agree", 10, 0, 99),  # perfect agreement: boost confidence
+    ("close", 0, 0, 100),  # close agreement: keep confidence
+    ("diverge", -10, 40, 100),  # moderate disagreement: reduce slightly
+    ("conflict", -20, 30, 100),  # strong disagreement: reduce significantly
+)
+
+# Folded wind bearing (0-180°) edges of the E/W and S Zambretti sectors; the
+# bisect index doubles as the forecast index adjustment (N=0, E/W=1, S=2).
+_ZAMBRETTI_WIND_EDGES: tuple[float, ...] = (45.0, 135.0)
+
+
+@dataclass(slots=True)
+class SagerResult:
+    """Outcome of one Sager table evaluation, refined by cross-validation."""
+
+    forecast_code: str
+    wind_velocity_key: str
+    wind_direction_key: str
+    hpa_level: int
+    wind_dir: str
+    wind_trend: str
+    pressure_trend: str
+    cloud_level: str
+    confidence: int
+    latitude_zone: str
+    sager_letter: str
+    # Second direction of a transition forecast (4-char table values only).
+    wind_direction_key2: str | None = None
+    # Filled in by _cross_validate().
+    cross_validation: str | None = None
+    zambretti_condition: str | None = None
+
 
 class SagerWeathercasterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Sager Weathercaster coordinator."""
@@ -172,8 +514,23 @@ class SagerWeathercasterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         )
         self._latitude = hass.config.latitude
         self._longitude = hass.config.longitude
-        self._zone_directions = self._get_zone_directions()
-        self._is_southern = self._latitude < 0
+        # Latitude never changes for the lifetime of the coordinator (a config
+        # change reloads the entry), so everything derived from it is fixed here.
+        self._zone_directions, self._zone_name = self._classify_zone()
+        self._wind_index_map: dict[str, int] = {
+            direction: idx for idx, direction in enumerate(self._zone_directions)
+        }
+        # Sign applied to the angular shift in _get_wind_trend: clockwise is
+        # veering in the Northern Hemisphere and backing in the Southern.
+        self._coriolis_sign = -1 if self._latitude < 0 else 1
+        # Source sensor entity ids and read specs, resolved once from config_data
+        # (an options or data change reloads the entry and rebuilds these).
+        self._sensor_specs = tuple(
+            (self.config_data.get(spec[0]), *spec[1:]) for spec in _NUMERIC_SENSORS
+        )
+        self._raining_entity: str | None = self.config_data.get(CONF_RAINING_ENTITY)
+        self._temp_entity: str | None = self.config_data.get(CONF_TEMPERATURE_ENTITY)
+        self._cloud_entity: str | None = self.config_data.get(CONF_CLOUD_COVER_ENTITY)
 
         # External HA weather entity client and cached data
         self._ext_weather_client: HAWeatherClient | None = (
@@ -182,7 +539,15 @@ class SagerWeathercasterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             else None
         )
         self._ext_weather_data: ExternalWeatherData | None = None
+        # Wall-clock time of the last successful fetch, reported to entities.
         self._ext_weather_last_fetch: datetime | None = None
+        # time.monotonic() deadline for the next fetch; keeps the "not due yet"
+        # path to a single float comparison.
+        self._ext_weather_next_fetch: float = 0.0
+        # Consecutive failed fetches; sets the retry backoff (see below).
+        self._ext_weather_failures: int = 0
+        # In-flight background refetch, see _async_schedule_external_weather_fetch.
+        self._ext_weather_task: asyncio.Task[None] | None = None
         # Multiplicative correction for local atmospheric turbidity/sensor offset.
         # Shared by the lux and W/m² cloud-cover paths; converges toward the
         # true local ratio of measured clear-sky value to modelled clear-sky
@@ -195,12 +560,24 @@ class SagerWeathercasterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             hass, 2, f"{DOMAIN}.calibration.{entry.entry_id}"
         )
         self._calibration_loaded: bool = False
+        # Factor as last loaded from / handed to storage; EMA jitter smaller
+        # than CALIBRATION_SAVE_MIN_DELTA from it does not schedule a write.
+        self._persisted_calibration_factor: float = 1.0
+        # True while a delayed calibration write is queued on self._store.
         self._calibration_dirty: bool = False
         # Set to True when local lux indicates clear sky but external weather
         # reports heavy cloud/fog; exposed as a diagnostic attribute so the
         # user can see when and how often the sources disagree.
         self._ext_weather_disagreement: bool = False
 
+        # Per-refresh snapshot of configured entity states (see _get_state).
+        self._state_snapshot: dict[str, State | None] = {}
+
+        # Inputs and outputs of the last Sager/Zambretti evaluation, used to
+        # skip recomputation while the source readings are unchanged.
+        self._last_forecast_inputs: tuple[Any, ...] | None = None
+        self._last_forecast: tuple[SagerResult, dict[str, Any]] | None = None
+
         # Retrospective forecast verification: store a snapshot of each forecast,
         # then score it against actual sensor readings VERIFICATION_WINDOW_H hours later.
         self._snapshot_store: Store[dict[str, Any]] = Store(
@@ -223,25 +600,15 @@ class SagerWeathercasterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """Return the manually configured calibration seed, or None if not set."""
         return self._initial_calib_factor
 
-    def _get_zone_directions(self) -> list[str]:
-        """Get zone-specific wind direction array based on latitude.
+    def _classify_zone(self) -> tuple[list[str], str]:
+        """Return the wind direction array and name of the latitude zone.
 
-        Returns the appropriate direction-to-index mapping for the
+        The direction array is the direction-to-index mapping for the
         configured latitude zone, following the Sager algorithm's
         hemisphere and climate zone adjustments.
         """
-        lat = self._latitude
-        if lat >= LATITUDE_NORTHERN_POLAR:
-            return ZONE_DIRECTIONS_NP  # Northern Polar
-        if lat >= LATITUDE_NORTHERN_TROPIC:
-            return ZONE_DIRECTIONS_NT  # Northern Temperate (standard)
-        if lat >= 0:
-            return ZONE_DIRECTIONS_NP  # Northern Tropical
-        if lat > LATITUDE_SOUTHERN_TROPIC:
-            return ZONE_DIRECTIONS_SP  # Southern Tropical
-        if lat > LATITUDE_SOUTHERN_POLAR:
-            return ZONE_DIRECTIONS_ST  # Southern Temperate
-        return ZONE_DIRECTIONS_SP  # Southern Polar
+        zone = bisect.bisect_right(_ZONE_EDGES, self._latitude)
+        return _ZONE_DIRECTIONS[zone], _ZONE_NAMES[zone]
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from sensors and calculate forecast."""
@@ -252,18 +619,47 @@ class SagerWeathercasterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             await self._async_load_snapshot()
 
         try:
-            # Fetch external HA weather entity data first so that
-            # _get_sensor_data() → _sky_to_cloud_cover() can use it for the
-            # nighttime / low-angle fallback on the very first run after a
-            # reload (when _ext_weather_data would otherwise still be None).
-            await self._async_fetch_external_weather()
+            # One clock read anchors every recorder window of this update, so
+            # the 6 h pressure and wind look-backs cover the same interval.
+            now = dt_util.utcnow()
+
+            # The external weather fetch and the wind recorder queries are
+            # independent I/O, so run them concurrently.  Until external data
+            # exists the fetch must finish before _get_sensor_data() so that
+            # _sky_to_cloud_cover() can use it for the nighttime / low-angle
+            # fallback on the very first run after a reload.  After that,
+            # refetches run in the background so a slow weather integration
+            # never delays the forecast.  Their result is not pushed to the
+            # entities: it is used from the next scheduled refresh on, so new
+            # external data reaches them up to one update interval late.
+            if self._ext_weather_data is None:
+                _, wind_historic, (mean_dir, mean_speed) = await asyncio.gather(
+                    self._async_fetch_external_weather(),
+                    self._async_compute_wind_historic(now),
+                    self._async_compute_vector_wind_avg(now),
+                )
+            else:
+                self._async_schedule_external_weather_fetch()
+                wind_historic, (mean_dir, mean_speed) = await asyncio.gather(
+                    self._async_compute_wind_historic(now),
+                    self._async_compute_vector_wind_avg(now),
+                )
+
+            # Take one state-machine snapshot of the configured sensors and the
+            # sun; every reader below (sensor data, cloud cover, sun elevation,
+            # turbidity, reliability) shares it instead of repeating
+            # hass.states.get(), and sees one consistent view per tick.
+            self._state_snapshot = {
+                entity_id: self.hass.states.get(entity_id)
+                for entity_id in (*self._configured_entity_ids(), _SUN_ENTITY_ID)
+            }
 
             # Get sensor data (with lux-to-cloud-cover conversion)
-            sensor_data = self._get_sensor_data()
+            sensor_data, input_status = self._get_sensor_data()
 
             # Use external weather cloud cover as fallback if no local sensor
             if (
-                not self.config_data.get(CONF_CLOUD_COVER_ENTITY)
+                not self._cloud_entity
                 and (ext_cloud := self._ext_cloud_cover()) is not None
             ):
                 sensor_data["cloud_cover"] = float(ext_cloud)
@@ -271,35 +667,29 @@ class SagerWeathercasterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             # Overwrite defaults with historically-computed values from recorder.
             # pressure_change and wind_historic default to 0 / current direction
             # in _get_sensor_data(); recorder results (when available) are used here.
+            # The pressure query needs the validated current reading, so it
+            # runs after _get_sensor_data().
             pressure_change = await self._async_compute_pressure_change(
-                sensor_data.get("pressure")
+                sensor_data.get("pressure"), now
             )
             if pressure_change is not None:
                 sensor_data["pressure_change"] = pressure_change
                 sensor_data["_pressure_change_from_recorder"] = True
 
-            wind_historic = await self._async_compute_wind_historic()
             if wind_historic is not None:
                 sensor_data["wind_historic"] = wind_historic
                 sensor_data["_wind_historic_from_recorder"] = True
 
-            mean_dir, mean_speed = await self._async_compute_vector_wind_avg()
             if mean_dir is not None:
                 sensor_data["wind_direction"] = mean_dir
             if mean_speed is not None:
                 sensor_data["wind_speed"] = mean_speed
 
             # Calculate reliability score
-            reliability = self._calculate_reliability(sensor_data)
+            reliability = self._calculate_reliability(sensor_data, input_status)
 
-            # Calculate Sager forecast
-            forecast = self._sager_algorithm(sensor_data)
-
-            # Calculate Zambretti forecast for cross-validation
-            zambretti = self._zambretti_forecast(sensor_data)
-
-            # Cross-validate: adjust confidence based on agreement
-            forecast = self._cross_validate(forecast, zambretti)
+            # Sager forecast, cross-validated against Zambretti
+            forecast, zambretti = self._compute_forecast(sensor_data)
         except ValueError as err:
             if self.last_update_success:
                 _LOGGER.warning("Sager Weathercaster is unavailable: %s", err)
@@ -308,16 +698,13 @@ class SagerWeathercasterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             if self.last_update_success:
                 _LOGGER.warning("Sager Weathercaster is unavailable: %s", err)
             raise UpdateFailed(f"Unexpected error during update: {err}") from err
+        finally:
+            self._state_snapshot = {}
 
         # Log recovery after a previous failure
         if not self.last_update_success:
             _LOGGER.info("Sager Weathercaster is back online")
 
-        # Persist calibration factor if it was updated during this cycle
-        if self._calibration_dirty:
-            await self._async_save_calibration()
-            self._calibration_dirty = False
-
         # Verify pending forecast if mature, then record current forecast
         self._update_forecast_snapshot(sensor_data, forecast)
         if self._snapshot_dirty:
@@ -348,6 +735,51 @@ class SagerWeathercasterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             "verification": self._build_verification_dict(),
         }
 
+    def _compute_forecast(
+        self, sensor_data: dict[str, Any]
+    ) -> tuple[SagerResult, dict[str, Any]]:
+        """Run Sager, Zambretti and cross-validation for one set of inputs.
+
+        Pure CPU work with no state-machine or I/O access, kept in one
+        synchronous method so it could be moved to an executor with a single
+        async_add_executor_job call.  It stays on the event loop because it
+        runs in microseconds, well below the cost of an executor hop.
+
+        The result is a pure function of the inputs below, so the previous
+        result is reused while none of them has changed.  The inputs are
+        compared exactly: rounding them would let a reading that crosses a
+        classification threshold (calm wind, cloud level, flurry
+        temperature, pressure trend, wind sector) reuse a stale forecast.
+        """
+        forecast_inputs = (
+            sensor_data["pressure"],
+            sensor_data["wind_direction"],
+            sensor_data["wind_speed"],
+            sensor_data["cloud_cover"],
+            sensor_data["raining"],
+            sensor_data["temperature"],
+            sensor_data["pressure_change"],
+            sensor_data["wind_historic"],
+        )
+        if (
+            self._last_forecast is not None
+            and forecast_inputs == self._last_forecast_inputs
+        ):
+            return self._last_forecast
+
+        # Calculate Sager forecast
+        forecast = self._sager_algorithm(sensor_data)
+
+        # Calculate Zambretti forecast for cross-validation
+        zambretti = self._zambretti_forecast(sensor_data)
+
+        # Cross-validate: adjust confidence based on agreement
+        forecast = self._cross_validate(forecast, zambretti)
+
+        self._last_forecast_inputs = forecast_inputs
+        self._last_forecast = (forecast, zambretti)
+        return self._last_forecast
+
     async def _async_query_history(
         self,
         entity_id: str,
@@ -362,9 +794,9 @@ class SagerWeathercasterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         entity has no history in the requested window.
 
         include_start_time_state=True (default): includes the state that was
-        active at `start`, even if it last changed before `start`.  Use for
-        short windows (e.g. 10-min wind average) where a recent stable reading
-        is valid.
+        active at `start`, even if it last changed before `start`.  Used for
+        the 10-min wind average, where that reading is in effect for the
+        first part of the window.
 
         include_start_time_state=False: returns only real state changes inside
         [start, end].  Use for 6 h look-backs to avoid a synthetic "start-time
@@ -390,7 +822,7 @@ class SagerWeathercasterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         return result.get(entity_id, [])
 
     async def _async_compute_pressure_change(
-        self, current_pressure: float | None
+        self, current_pressure: float | None, now: datetime
     ) -> float | None:
         """Return the 6h pressure change in hPa, computed from recorder history.
 
@@ -403,7 +835,6 @@ class SagerWeathercasterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         if not entity_id or current_pressure is None:
             return None
 
-        now = dt_util.utcnow()
         # Query a 2 h window ending at ALGORITHM_WINDOW_HOURS ago.  Using
         # include_start_time_state=False means only real recorded state changes
         # are returned — the recorder's synthetic "start-time state" would have
@@ -435,7 +866,7 @@ class SagerWeathercasterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         )
         return max(-50.0, min(50.0, change))
 
-    async def _async_compute_wind_historic(self) -> float | None:
+    async def _async_compute_wind_historic(self, now: datetime) -> float | None:
         """Return the wind direction from ALGORITHM_WINDOW_HOURS ago via recorder.
 
         Returns None when the recorder has insufficient history.
@@ -444,7 +875,6 @@ class SagerWeathercasterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         if not entity_id:
             return None
 
-        now = dt_util.utcnow()
         # Same reasoning as _async_compute_pressure_change: use a 2 h window
         # ending at ALGORITHM_WINDOW_HOURS ago with include_start_time_state=False
         # so that only real recorded changes are returned.
@@ -469,13 +899,14 @@ class SagerWeathercasterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         return direction
 
     async def _async_compute_vector_wind_avg(
-        self,
+        self, now: datetime
     ) -> tuple[float | None, float | None]:
         """Return vector-averaged (direction, speed) over the last WIND_AVERAGE_WINDOW_MINUTES.
 
-        Uses the circular mean of all recorded direction readings in the window,
-        weighted uniformly (not by speed) to keep the computation simple.
-        Speed is the scalar mean of all speed readings in the window.
+        Each reading in effect during the window, including the one already
+        active at its start, is weighted by how long it was in effect.
+        Direction is the time-weighted circular mean (not weighted by speed,
+        to keep the computation simple); speed is the time-weighted scalar mean.
 
         Returns (None, None) when no direction history is available.
         """
@@ -483,49 +914,51 @@ class SagerWeathercasterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         if not dir_entity_id:
             return None, None
 
-        now = dt_util.utcnow()
         start = now - timedelta(minutes=WIND_AVERAGE_WINDOW_MINUTES)
 
+        # The start-time state is kept: a sensor that changes rarely spends
+        # most of the window on the reading that was active when it began.
         dir_states = await self._async_query_history(dir_entity_id, start, now)
-
-        directions: list[float] = []
-        for state in dir_states:
-            if state.state in ("unavailable", "unknown", "none"):
-                continue
-            try:
-                d = float(state.state)
-                if WIND_DIR_MIN <= d <= WIND_DIR_MAX:
-                    directions.append(d)
-            except (ValueError, TypeError):
-                pass
+        directions = _time_weighted_readings(
+            dir_states, start, now, WIND_DIR_MIN, WIND_DIR_MAX
+        )
 
         if not directions:
             return None, None
 
-        sin_sum = sum(math.sin(math.radians(d)) for d in directions)
-        cos_sum = sum(math.cos(math.radians(d)) for d in directions)
+        sin_sum = 0.0
+        cos_sum = 0.0
+        for d, seconds in directions:
+            whole = int(d)
+            if whole == d:
+                sin_sum += seconds * _SIN_LUT[whole % 360]
+                cos_sum += seconds * _COS_LUT[whole % 360]
+            else:
+                # Sub-degree reading: keep full precision.
+                rad = math.radians(d)
+                sin_sum += seconds * math.sin(rad)
+                cos_sum += seconds * math.cos(rad)
         mean_dir = math.degrees(math.atan2(sin_sum, cos_sum)) % 360
 
         mean_speed: float | None = None
         speed_entity_id = self.config_data.get(CONF_WIND_SPEED_ENTITY)
         if speed_entity_id:
             speed_states = await self._async_query_history(speed_entity_id, start, now)
-            speeds: list[float] = [
-                float(s.state)
-                for s in speed_states
-                if s.state not in ("unavailable", "unknown", "none")
-                and _is_valid_float(s.state)
-                and WIND_SPEED_MIN <= float(s.state) <= WIND_SPEED_MAX
-            ]
+            speeds = _time_weighted_readings(
+                speed_states, start, now, WIND_SPEED_MIN, WIND_SPEED_MAX
+            )
             if speeds:
-                mean_speed = sum(speeds) / len(speeds)
+                mean_speed = sum(v * sec for v, sec in speeds) / sum(
+                    sec for _, sec in speeds
+                )
 
-        _LOGGER.debug(
-            "Vector wind avg: dir=%.1f° (%d samples), speed=%s",
-            mean_dir,
-            len(directions),
-            f"{mean_speed:.1f}" if mean_speed is not None else "n/a",
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Vector wind avg: dir=%.1f° (%d samples), speed=%s",
+                mean_dir,
+                len(directions),
+                f"{mean_speed:.1f}" if mean_speed is not None else "n/a",
+            )
         return mean_dir, mean_speed
 
     def _ext_cloud_cover(self) -> int | None:
@@ -549,68 +982,137 @@ class SagerWeathercasterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             None,
         )
 
+    @callback
+    def _async_schedule_external_weather_fetch(self) -> None:
+        """Start a background external weather fetch if one is due.
+
+        The task is owned by the config entry, so it is cancelled on unload.
+        """
+        if self._ext_weather_client is None or (
+            self._ext_weather_task is not None and not self._ext_weather_task.done()
+        ):
+            return
+        if time.monotonic() < self._ext_weather_next_fetch:
+            return
+        self._ext_weather_task = self.config_entry.async_create_background_task(
+            self.hass,
+            self._async_fetch_external_weather(),
+            f"{DOMAIN} external weather fetch",
+        )
+
     async def _async_fetch_external_weather(self) -> None:
         """Fetch external HA weather entity data if the update interval has elapsed."""
         if self._ext_weather_client is None:
             return
 
-        now = dt_util.utcnow()
-        interval = timedelta(minutes=EXTERNAL_WEATHER_UPDATE_INTERVAL_MINUTES)
+        now = time.monotonic()
+        if now < self._ext_weather_next_fetch:
+            return
 
-        if (
-            self._ext_weather_last_fetch is not None
-            and now - self._ext_weather_last_fetch < interval
-        ):
+        try:
+            data = await self._ext_weather_client.async_get_data()
+        except Exception:  # noqa: BLE001
+            # Nothing awaits the background task, so an error escaping the
+            # weather integration would otherwise end it without a backoff.
+            _LOGGER.debug(
+                "External weather fetch from %s failed",
+                self._ext_weather_entity,
+                exc_info=True,
+            )
+            data = None
+        if data is None:
+            # Back off while the entity is missing, unavailable or failing:
+            # retry after one update interval, doubling per consecutive
+            # failure up to the regular fetch interval, instead of refetching
+            # on every tick.
+            self._ext_weather_failures += 1
+            retry_minutes = min(
+                UPDATE_INTERVAL_MINUTES * 2 ** (self._ext_weather_failures - 1),
+                EXTERNAL_WEATHER_UPDATE_INTERVAL_MINUTES,
+            )
+            self._ext_weather_next_fetch = now + retry_minutes * 60
             return
 
-        data = await self._ext_weather_client.async_get_data()
-        if data is not None:
-            self._ext_weather_data = data
-            self._ext_weather_last_fetch = now
+        self._ext_weather_failures = 0
+        self._ext_weather_data = data
+        self._ext_weather_last_fetch = dt_util.utcnow()
+        self._ext_weather_next_fetch = (
+            now + EXTERNAL_WEATHER_UPDATE_INTERVAL_MINUTES * 60
+        )
+
+    def _configured_entity_ids(self) -> list[str]:
+        """Return the entity IDs of all configured source sensors."""
+        return [
+            entity_id
+            for key in _SENSOR_ENTITY_KEYS
+            if (entity_id := self.config_data.get(key))
+        ]
+
+    def _get_state(self, entity_id: str) -> State | None:
+        """Return the state of *entity_id*, from the refresh snapshot if taken."""
+        if entity_id in self._state_snapshot:
+            return self._state_snapshot[entity_id]
+        return self.hass.states.get(entity_id)
+
+    @staticmethod
+    def _parse_float_state(
+        entity_id: str,
+        state: State | None,
+        default: float | None,
+        min_val: float,
+        max_val: float,
+    ) -> float | None:
+        """Return the numeric value of an already fetched *state*, or *default*.
 
-    def _get_sensor_data(self) -> dict[str, Any]:
-        """Get input data from configured entities."""
+        Missing, unavailable and unknown entities silently yield the default;
+        non-numeric or out-of-range values are logged before falling back.
+        """
+        if not _is_valid_state(state):
+            return default
+        try:
+            value = float(state.state)
+        except (ValueError, TypeError) as err:
+            _LOGGER.warning(
+                "Invalid value for %s: %s (%s), using default %s",
+                entity_id,
+                state.state,
+                err,
+                default,
+            )
+            return default
+        if not min_val <= value <= max_val:
+            _LOGGER.warning(
+                "Value out of range for %s: %s (expected %s-%s), using default %s",
+                entity_id,
+                value,
+                min_val,
+                max_val,
+                default,
+            )
+            return default
+        return value
+
+    def _get_sensor_data(self) -> tuple[dict[str, Any], dict[str, str]]:
+        """Get input data from configured entities.
+
+        Also returns the per-input status ("ok", "unavailable" or
+        "not configured") consumed by _calculate_reliability(), so each
+        entity state is looked up only once per refresh.
+        """
         data: dict[str, Any] = {}
+        status: dict[str, str] = {}
+        get_state = self._get_state
+        parse_float = self._parse_float_state
 
         # Sensors with standard numeric range validation
-        entities_map = {
-            CONF_PRESSURE_ENTITY: ("pressure", 1013.25, PRESSURE_MIN, PRESSURE_MAX),
-            CONF_WIND_DIR_ENTITY: ("wind_direction", 0, WIND_DIR_MIN, WIND_DIR_MAX),
-            CONF_WIND_SPEED_ENTITY: ("wind_speed", 0, WIND_SPEED_MIN, WIND_SPEED_MAX),
-        }
-
-        for config_key, (data_key, default, min_val, max_val) in entities_map.items():
-            entity_id = self.config_data.get(config_key)
-            if entity_id:
-                state = self.hass.states.get(entity_id)
-                if state and state.state not in ("unavailable", "unknown", "none"):
-                    try:
-                        value = float(state.state)
-                        if min_val <= value <= max_val:
-                            data[data_key] = value
-                        else:
-                            _LOGGER.warning(
-                                "Value out of range for %s: %s (expected %s-%s), using default %s",
-                                entity_id,
-                                value,
-                                min_val,
-                                max_val,
-                                default,
-                            )
-                            data[data_key] = default
-                    except (ValueError, TypeError) as err:
-                        _LOGGER.warning(
-                            "Invalid value for %s: %s (%s), using default %s",
-                            entity_id,
-                            state.state,
-                            err,
-                            default,
-                        )
-                        data[data_key] = default
-                else:
-                    data[data_key] = default
-            else:
+        for entity_id, data_key, default, min_val, max_val in self._sensor_specs:
+            if not entity_id:
                 data[data_key] = default
+                status[data_key] = "not configured"
+                continue
+            state = get_state(entity_id)
+            status[data_key] = "ok" if _is_valid_state(state) else "unavailable"
+            data[data_key] = parse_float(entity_id, state, default, min_val, max_val)
 
         # Defaults for historically-computed fields; overwritten in _async_update_data
         # once the recorder query results are available.
@@ -619,49 +1121,36 @@ class SagerWeathercasterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         # Cloud cover: auto-detect lux vs percentage by unit_of_measurement
         data["cloud_cover"] = self._get_cloud_cover()
+        if not self._cloud_entity:
+            status["cloud_cover"] = "not configured"
+        elif _is_valid_state(get_state(self._cloud_entity)):
+            status["cloud_cover"] = "ok"
+        else:
+            status["cloud_cover"] = "unavailable"
 
         # Rain sensor: binary (on/true/1) or numeric mm/h >= threshold
-        raining_entity = self.config_data.get(CONF_RAINING_ENTITY)
+        data["raining"] = False
+        raining_entity = self._raining_entity
         if raining_entity:
-            rain_state = self.hass.states.get(raining_entity)
-            if rain_state and rain_state.state not in (
-                "unavailable",
-                "unknown",
-                "none",
-            ):
-                if rain_state.state in ("on", "true", "1"):
+            rain_state = self._get_state(raining_entity)
+            if _is_valid_state(rain_state):
+                if rain_state.state in _TRUE_STATES:
                     data["raining"] = True
                 else:
-                    data["raining"] = False
-                    with contextlib.suppress(ValueError, TypeError):
+                    try:
                         data["raining"] = (
                             float(rain_state.state) >= RAIN_THRESHOLD_LIGHT
                         )
-            else:
-                data["raining"] = False
-        else:
-            data["raining"] = False
+                    except (ValueError, TypeError):
+                        pass
 
         # Temperature for forecast refinement (showers vs flurries)
-        temp_entity = self.config_data.get(CONF_TEMPERATURE_ENTITY)
-        if temp_entity:
-            temp_state = self.hass.states.get(temp_entity)
-            if temp_state and temp_state.state not in (
-                "unavailable",
-                "unknown",
-                "none",
-            ):
-                data["temperature"] = None
-                with contextlib.suppress(ValueError, TypeError):
-                    data["temperature"] = float(temp_state.state)
-            else:
-                data["temperature"] = None
-        else:
-            data["temperature"] = None
+        # (silently None when unset, unavailable or non-numeric; not range-checked)
+        data["temperature"] = self._get_temperature_celsius()
 
-        return data
+        return data, status
 
-    def _sager_algorithm(self, data: dict[str, Any]) -> dict[str, Any]:
+    def _sager_algorithm(self, data: dict[str, Any]) -> SagerResult:
         """Complete Sager weather algorithm using the full Sager Weathercaster lookup table.
 
         Implements the original Sager Weathercaster algorithm with 25-letter
@@ -672,23 +1161,22 @@ class SagerWeathercasterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             data: Dictionary containing sensor data (pressure, wind, clouds, etc.)
 
         Returns:
-            Dictionary containing forecast text and analysis parameters
+            SagerResult with the forecast code and analysis parameters
 
         Raises:
             ValueError: If algorithm calculation fails
         """
-        # Calculate input variables
+        # Calculate input variables (inputs bound once to locals)
+        wind_direction = data["wind_direction"]
+        temperature = data.get("temperature")
         z_hpa = self._get_hpa_level(data["pressure"])
-        z_wind = self._get_wind_dir(data["wind_direction"], data["wind_speed"])
-        z_rumbo = self._get_wind_trend(data["wind_direction"], data["wind_historic"])
+        z_wind = self._get_wind_dir(wind_direction, data["wind_speed"])
+        z_rumbo = self._get_wind_trend(wind_direction, data["wind_historic"])
         z_trend = self._get_pressure_trend(data["pressure_change"])
         z_nubes = self._get_cloud_level(data["cloud_cover"], data["raining"])
 
         # Zone-aware wind direction index (0-7)
-        wind_index_map = {
-            direction: idx for idx, direction in enumerate(self._zone_directions)
-        }
-        wind_index = wind_index_map.get(z_wind)
+        wind_index = self._wind_index_map.get(z_wind)
 
         # Compute the Sager wind letter (A-Y) or Z for calm
         # trend_offset: 0=backing, 1=steady, 2=veering (z_rumbo: 1=steady, 2=veering, 3=backing)
@@ -699,17 +1187,22 @@ class SagerWeathercasterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             trend_offset = (0, 1, 2, 0)[z_rumbo]  # 1→1, 2→2, 3→0
             wind_letter = WIND_LETTERS[wind_index * 3 + trend_offset]
 
-        # Build lookup key: letter + hpa + pressure_trend + cloud
-        lookup_key = f"{wind_letter}{z_hpa}{z_trend}{z_nubes}"
-
-        value = SAGER_TABLE.get(lookup_key)
+        # Table lookup: letter + hpa + pressure_trend + cloud, packed into a
+        # flat list index so no string key is built on the hot path.
+        value = SAGER_TABLE_INDEXED[
+            sager_table_index(wind_letter, z_hpa, z_trend, z_nubes)
+        ]
         if value is not None:
             confidence = 95
         else:
+            # Key string is rendered by the logger's %-formatting only.
             _LOGGER.warning(
-                "Combination not found in Sager table: %s "
+                "Combination not found in Sager table: %s%d%d%d "
                 "(letter:%s, hpa:%d, pressure_trend:%d, cloud:%d), using default",
-                lookup_key,
+                wind_letter,
+                z_hpa,
+                z_trend,
+                z_nubes,
                 wind_letter,
                 z_hpa,
                 z_trend,
@@ -719,76 +1212,33 @@ class SagerWeathercasterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             confidence = 60
 
         # Decode value: forecast_letter + velocity_letter + direction_digit(s)
-        forecast_code = value[0].lower()
-        velocity_letter = value[1]
-        dir1_digit = int(value[2])
-        dir2_digit = int(value[3]) if len(value) == 4 else None
+        (
+            forecast_code,
+            wind_velocity_key,
+            wind_direction_key,
+            wind_direction_key2,
+        ) = _decode_sager_value(value)
 
         # Temperature-based refinement: shower codes get "1" (rain) or "2" (snow/flurry)
         if forecast_code in SHOWER_FORECAST_CODES:
-            temperature = data.get("temperature")
             if temperature is not None:
                 forecast_code += "1" if temperature > TEMP_THRESHOLD_FLURRIES else "2"
 
-        # Velocity letter → key (N=increasing, U=unchanged, D=decreasing, etc.)
-        wind_vel_idx = VELOCITY_LETTER_TO_INDEX.get(velocity_letter, 7)
-        wind_velocity_key = (
-            WIND_VELOCITY_KEYS[wind_vel_idx]
-            if wind_vel_idx < len(WIND_VELOCITY_KEYS)
-            else "no_significant_change"
-        )
-
-        # Direction digit 1-9 → index 0-8 in WIND_DIRECTION_KEYS
-        dir1_idx = dir1_digit - 1
-        wind_direction_key = (
-            WIND_DIRECTION_KEYS[dir1_idx]
-            if 0 <= dir1_idx < len(WIND_DIRECTION_KEYS)
-            else "variable"
+        return SagerResult(
+            forecast_code=forecast_code,
+            wind_velocity_key=wind_velocity_key,
+            wind_direction_key=wind_direction_key,
+            hpa_level=z_hpa,
+            wind_dir=z_wind,
+            wind_trend=_TREND_NAMES[z_rumbo - 1],
+            pressure_trend=_PRESSURE_NAMES[z_trend - 1],
+            cloud_level=_CLOUD_NAMES[z_nubes - 1],
+            confidence=confidence,
+            latitude_zone=self._zone_name,
+            sager_letter=wind_letter,
+            wind_direction_key2=wind_direction_key2,
         )
 
-        # Optional second direction (transition forecast)
-        wind_direction_key2: str | None = None
-        if dir2_digit is not None:
-            dir2_idx = dir2_digit - 1
-            wind_direction_key2 = (
-                WIND_DIRECTION_KEYS[dir2_idx]
-                if 0 <= dir2_idx < len(WIND_DIRECTION_KEYS)
-                else None
-            )
-
-        trend_names = [WIND_TREND_STEADY, WIND_TREND_VEERING, WIND_TREND_BACKING]
-        pressure_names = [
-            PRESSURE_TREND_RISING_RAPIDLY,
-            PRESSURE_TREND_RISING_SLOWLY,
-            PRESSURE_TREND_NORMAL,
-            PRESSURE_TREND_DECREASING_SLOWLY,
-            PRESSURE_TREND_DECREASING_RAPIDLY,
-        ]
-        cloud_names = [
-            CLOUD_LEVEL_CLEAR,
-            CLOUD_LEVEL_PARTLY_CLOUDY,
-            CLOUD_LEVEL_MOSTLY_CLOUDY,
-            CLOUD_LEVEL_OVERCAST,
-            CLOUD_LEVEL_RAINING,
-        ]
-
-        result: dict[str, Any] = {
-            "forecast_code": forecast_code,
-            "wind_velocity_key": wind_velocity_key,
-            "wind_direction_key": wind_direction_key,
-            "hpa_level": z_hpa,
-            "wind_dir": z_wind,
-            "wind_trend": trend_names[z_rumbo - 1],
-            "pressure_trend": pressure_names[z_trend - 1],
-            "cloud_level": cloud_names[z_nubes - 1],
-            "confidence": confidence,
-            "latitude_zone": self._get_zone_name(),
-            "sager_letter": wind_letter,
-        }
-        if wind_direction_key2 is not None:
-            result["wind_direction_key2"] = wind_direction_key2
-        return result
-
     def _get_hpa_level(self, hpa: float) -> int:
         """Get pressure level 1-8.
 
@@ -798,10 +1248,7 @@ class SagerWeathercasterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         Returns:
             Pressure level from 1 (very high) to 8 (extremely low)
         """
-        for max_hpa, min_hpa, level in HPA_LEVELS:
-            if min_hpa <= hpa < max_hpa:
-                return level
-        return 8  # Lowest pressure
+        return _HPA_LEVEL_BY_INDEX[bisect.bisect_right(_HPA_CUTOFFS, hpa)]
 
     def _get_wind_dir(self, direction: float, speed: float) -> str:
         """Get 8-point cardinal wind direction.
@@ -815,18 +1262,7 @@ class SagerWeathercasterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """
         if speed <= 1:
             return WIND_CARDINAL_CALM
-        dirs = [
-            WIND_CARDINAL_N,
-            WIND_CARDINAL_NE,
-            WIND_CARDINAL_E,
-            WIND_CARDINAL_SE,
-            WIND_CARDINAL_S,
-            WIND_CARDINAL_SW,
-            WIND_CARDINAL_W,
-            WIND_CARDINAL_NW,
-        ]
-        idx = int((direction + 22.5) / 45) % 8
-        return dirs[idx]
+        return _WIND_SECTOR_LUT[int(direction * 2) % 720]
 
     def _get_wind_trend(self, current: float, historic: float) -> int:
         """Get wind trend, hemisphere-aware.
@@ -850,11 +1286,8 @@ class SagerWeathercasterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         if abs(diff) <= 45:
             return 1  # STEADY
 
-        # In Southern Hemisphere, backing and veering are reversed
-        if self._is_southern:
-            return 3 if diff > 0 else 2
-
-        return 2 if diff > 0 else 3  # NH: clockwise=veering, counter=backing
+        # NH: clockwise=veering, counter=backing; reversed in the SH
+        return 2 if diff * self._coriolis_sign > 0 else 3
 
     def _get_pressure_trend(self, change: float) -> int:
         """Get pressure trend.
@@ -866,15 +1299,7 @@ class SagerWeathercasterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             1 for Rising Rapidly, 2 for Rising Slowly, 3 for Normal,
             4 for Decreasing Slowly, 5 for Decreasing Rapidly
         """
-        if change > 1.4:
-            return 1
-        if change > 0.68:
-            return 2
-        if change > -0.68:
-            return 3
-        if change > -1.4:
-            return 4
-        return 5
+        return 5 - bisect.bisect_left(_PRESSURE_TREND_THRESHOLDS, change)
 
     def _get_cloud_level(self, cover: float, raining: bool) -> int:
         """Get cloud level.
@@ -889,28 +1314,7 @@ class SagerWeathercasterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """
         if raining:
             return 5
-        if cover > 80:
-            return 4
-        if cover > 50:
-            return 3
-        if cover > 20:
-            return 2
-        return 1
-
-    def _get_zone_name(self) -> str:
-        """Get human-readable name of the current latitude zone."""
-        lat = self._latitude
-        if lat >= LATITUDE_NORTHERN_POLAR:
-            return "Northern Polar"
-        if lat >= LATITUDE_NORTHERN_TROPIC:
-            return "Northern Temperate"
-        if lat >= 0:
-            return "Northern Tropical"
-        if lat > LATITUDE_SOUTHERN_TROPIC:
-            return "Southern Tropical"
-        if lat > LATITUDE_SOUTHERN_POLAR:
-            return "Southern Temperate"
-        return "Southern Polar"
+        return 1 + bisect.bisect_left(_CLOUD_LEVEL_THRESHOLDS, cover)
 
     def _get_cloud_cover(self) -> float:
         """Get cloud cover percentage, auto-detecting the sensor unit.
@@ -923,12 +1327,12 @@ class SagerWeathercasterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
           using the solar-constant coefficient — the most accurate input since
           the Kasten formula was designed for irradiance.
         """
-        entity_id = self.config_data.get(CONF_CLOUD_COVER_ENTITY)
+        entity_id = self._cloud_entity
         if not entity_id:
             return 0.0
 
-        state = self.hass.states.get(entity_id)
-        if not state or state.state in ("unavailable", "unknown", "none"):
+        state = self._get_state(entity_id)
+        if not _is_valid_state(state):
             return 0.0
 
         try:
@@ -951,22 +1355,26 @@ class SagerWeathercasterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
     def _get_temperature_celsius(self) -> float | None:
         """Return current air temperature (°C) from the configured sensor, or None."""
-        entity_id = self.config_data.get(CONF_TEMPERATURE_ENTITY)
+        entity_id = self._temp_entity
         if entity_id:
-            state = self.hass.states.get(entity_id)
-            if state and state.state not in ("unavailable", "unknown", "none"):
-                with contextlib.suppress(ValueError, TypeError):
+            state = self._get_state(entity_id)
+            if _is_valid_state(state):
+                try:
                     return float(state.state)
+                except (ValueError, TypeError):
+                    pass
         return None
 
     def _get_current_pressure(self) -> float:
         """Return current barometric pressure (hPa); falls back to ISA sea-level value."""
         entity_id = self.config_data.get(CONF_PRESSURE_ENTITY)
         if entity_id:
-            state = self.hass.states.get(entity_id)
-            if state and state.state not in ("unavailable", "unknown", "none"):
-                with contextlib.suppress(ValueError, TypeError):
+            state = self._get_state(entity_id)
+            if _is_valid_state(state):
+                try:
                     return float(state.state)
+                except (ValueError, TypeError):
+                    pass
         return 1013.25
 
     def _compute_vapor_pressure(self) -> float | None:
@@ -981,31 +1389,30 @@ class SagerWeathercasterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # Priority 1: dewpoint → direct e_a
         dew_entity = self.config_data.get(CONF_DEWPOINT_ENTITY)
         if dew_entity:
-            dew_state = self.hass.states.get(dew_entity)
-            if dew_state and dew_state.state not in ("unavailable", "unknown", "none"):
-                td: float | None = None
-                with contextlib.suppress(ValueError, TypeError):
+            dew_state = self._get_state(dew_entity)
+            if _is_valid_state(dew_state):
+                try:
                     td = float(dew_state.state)
-                if td is not None:
-                    return 6.112 * math.exp(17.67 * td / (td + 243.5))
+                except (ValueError, TypeError):
+                    pass
+                else:
+                    return _magnus_vapor_pressure(td)
 
         # Priority 2 & 3: humidity (with or without temperature)
         rh_entity = self.config_data.get(CONF_HUMIDITY_ENTITY)
         if not rh_entity:
             return None
-        rh_state = self.hass.states.get(rh_entity)
-        if not rh_state or rh_state.state in ("unavailable", "unknown", "none"):
+        rh_state = self._get_state(rh_entity)
+        if not _is_valid_state(rh_state):
             return None
-        rh: float | None = None
-        with contextlib.suppress(ValueError, TypeError):
+        try:
             rh = float(rh_state.state)
-        if rh is None:
+        except (ValueError, TypeError):
             return None
 
         # Saturation vapor pressure at actual temperature (or 15 °C default)
         t_c = self._get_temperature_celsius() or 15.0
-        e_s = 6.112 * math.exp(17.67 * t_c / (t_c + 243.5))
-        return e_s * (rh / 100.0)
+        return _magnus_vapor_pressure(t_c) * (rh / 100.0)
 
     def _linke_turbidity(self, pressure: float) -> float:
         """Estimate Linke turbidity TL from measurable atmospheric inputs.
@@ -1027,8 +1434,8 @@ class SagerWeathercasterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         # Precipitable water W (cm) via Reitan (1963) / pvlib formula.
         # Requires dewpoint Td, derived here from e_a via inverse Magnus.
-        log_ea = math.log(vapor_pressure / 6.112)
-        td_celsius = 243.5 * log_ea / (17.67 - log_ea)
+        log_ea = math.log(vapor_pressure / _MAGNUS_A)
+        td_celsius = _MAGNUS_C * log_ea / (_MAGNUS_B - log_ea)
         w_cm = max(0.1, math.exp(0.07 * td_celsius - 0.075))
 
         p_ratio = pressure / 1013.25
@@ -1039,13 +1446,14 @@ class SagerWeathercasterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             + 0.376 * math.log(w_cm)
             + 3.91 * tau_a * math.exp(0.689 * p_ratio)
         )
-        _LOGGER.debug(
-            "Linke turbidity TL=%.2f (W=%.2f cm, e_a=%.1f hPa, P=%.0f hPa)",
-            tl,
-            w_cm,
-            vapor_pressure,
-            pressure,
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Linke turbidity TL=%.2f (W=%.2f cm, e_a=%.1f hPa, P=%.0f hPa)",
+                tl,
+                w_cm,
+                vapor_pressure,
+                pressure,
+            )
         return max(1.0, tl)
 
     def _sky_to_cloud_cover(
@@ -1069,7 +1477,7 @@ class SagerWeathercasterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         Falls back to external weather cloud cover during night/low-angle twilight.
         """
-        sun_state = self.hass.states.get("sun.sun")
+        sun_state = self._get_state(_SUN_ENTITY_ID)
         if not sun_state:
             return 50.0
 
@@ -1091,30 +1499,25 @@ class SagerWeathercasterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # altitude (via HA config + measured pressure) and atmospheric moisture
         # (via Linke turbidity TL) are now physically modelled rather than
         # approximated with fixed European-climate coefficients.
-        altitude_m = float(self.hass.config.elevation or 0)
-        fh1 = math.exp(-altitude_m / 8000.0)  # altitude factor 1 (Rayleigh)
-        fh2 = math.exp(-altitude_m / 1250.0)  # altitude factor 2 (aerosol)
-        cg1 = 5.09e-5 * altitude_m + 0.868  # model constant 1
-        cg2 = 3.92e-5 * altitude_m + 0.0387  # model constant 2
-
-        cos_zenith = math.cos(math.radians(90.0 - elevation))
-        sin_elev = math.sin(math.radians(elevation))
-
-        # Earth-Sun distance correction: orbital eccentricity causes the
-        # extraterrestrial irradiance to vary ±3.3% through the year
-        # (perihelion ~Jan 3: +3.3%; aphelion ~Jul 4: −3.3%).  Spencer (1971)
-        # approximation, accurate to ±0.01%.  Without this factor the model
-        # over-predicts in winter and under-predicts in summer by up to 3.3%,
-        # which the EMA calibration would otherwise have to absorb as a
-        # seasonal drift.
+        # The altitude and day-of-year terms only change with their (rarely
+        # changing) inputs, so they come from LRU-cached helpers.  The sun
+        # geometry moves every tick and is recomputed each time.
+        fh1, fh2, cg1, cg2 = _ineichen_altitude_factors(
+            float(self.hass.config.elevation or 0)
+        )
+        cos_zenith, airmass_rel = _solar_geometry(float(elevation))
+
+        # Earth-Sun distance correction (see _solar_day_terms).  Without this
+        # factor the model over-predicts in winter and under-predicts in
+        # summer by up to 3.3%, which the EMA calibration would otherwise have
+        # to absorb as a seasonal drift.
         doy = dt_util.now().timetuple().tm_yday
-        earth_sun_factor = 1.0 + 0.033 * math.cos(2.0 * math.pi * doy / 365.0)
+        earth_sun_factor, noon_elevation = _solar_day_terms(doy, self._latitude)
 
         # Kasten & Young (1989) relative airmass, pressure-corrected for altitude.
         # Using measured barometric pressure makes the airmass accurate for any
         # altitude — high-altitude sites get correctly lower airmass values.
         pressure = self._get_current_pressure()
-        airmass_rel = (1229 + (614 * sin_elev) ** 2) ** 0.5 - 614 * sin_elev
         airmass_abs = airmass_rel * (pressure / 1013.25)
 
         # Linke turbidity encapsulates all atmospheric extinction (Rayleigh,
@@ -1123,13 +1526,17 @@ class SagerWeathercasterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         tl = self._linke_turbidity(pressure)
 
         # Ineichen-Perez GHI (W/m²) with Earth-Sun distance correction.
+        # The extinction and airmass-correction exponentials are fused into a
+        # single exp() call: e^a × e^b = e^(a + b).
         ghi = (
             cg1
             * SOLAR_CONSTANT_WM2
             * earth_sun_factor
             * cos_zenith
-            * math.exp(-cg2 * airmass_abs * (fh1 + fh2 * (tl - 1)))
-            * math.exp(0.01 * airmass_abs**1.8)
+            * math.exp(
+                0.01 * airmass_abs**1.8
+                - cg2 * airmass_abs * (fh1 + fh2 * (tl - 1))
+            )
         )
 
         # Convert GHI to the sensor's unit.  The luminous efficacy constant is
@@ -1162,19 +1569,6 @@ class SagerWeathercasterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # the guard meaningful when noon elevation is very low or negative.
         # For locations/seasons where noon elevation never exceeds 10° the
         # manual CONF_INITIAL_CALIBRATION_FACTOR option can seed the factor.
-        #
-        # Solar declination (Spencer 1971 simplified):
-        decl = math.radians(
-            23.45 * math.sin(math.radians(360.0 / 365.0 * (doy - 81.0)))
-        )
-        lat_rad = math.radians(self._latitude)
-        noon_elev_sin = (
-            math.sin(lat_rad) * math.sin(decl)
-            + math.cos(lat_rad) * math.cos(decl)
-        )
-        noon_elevation = math.degrees(
-            math.asin(max(-1.0, min(1.0, noon_elev_sin)))
-        )
         calib_min_elevation = max(10.0, noon_elevation * 0.75)
         #
         # Use _ext_cloud_cover() (same best-available logic as the display path)
@@ -1194,36 +1588,43 @@ class SagerWeathercasterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 self._sky_calibration_factor = (
                     1.0 - alpha
                 ) * self._sky_calibration_factor + alpha * observed_factor
-                self._calibration_dirty = True
-                _LOGGER.debug(
-                    "Sky calibration updated: factor=%.3f"
-                    " (observed=%.3f, ext cloud=%.1f%%, elev=%.1f° ≥ %.1f° noon×0.75)",
-                    self._sky_calibration_factor,
-                    observed_factor,
-                    ext_cloud_now,
-                    elevation,
-                    calib_min_elevation,
-                )
+                self._async_schedule_calibration_save()
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug(
+                        "Sky calibration updated: factor=%.3f"
+                        " (observed=%.3f, ext cloud=%.1f%%,"
+                        " elev=%.1f° ≥ %.1f° noon×0.75)",
+                        self._sky_calibration_factor,
+                        observed_factor,
+                        ext_cloud_now,
+                        elevation,
+                        calib_min_elevation,
+                    )
 
         # Step 3 — apply residual calibration and derive cloud cover.
-        calibrated_clear_sky = clear_sky * self._sky_calibration_factor
+        calibration = self._sky_calibration_factor
+        calibrated_clear_sky = clear_sky * calibration
 
         # Ratio > 1 means clouds are reducing measured value below clear-sky.
         ratio = calibrated_clear_sky / max(value, 0.001)
         cloud_cover = math.log(ratio) * 100.0
-        _LOGGER.debug(
-            "%s %.1f → GHI %.1f W/m² (E₀×%.4f) → clear_sky %.1f"
-            " (TL=%.2f calib×%.3f) → cloud %.1f%%",
-            input_label,
-            value,
-            ghi,
-            earth_sun_factor,
-            calibrated_clear_sky,
-            tl,
-            self._sky_calibration_factor,
-            round(cloud_cover, 1),
-        )
-        cloud_cover = max(0.0, min(100.0, cloud_cover))
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "%s %.1f → GHI %.1f W/m² (E₀×%.4f) → clear_sky %.1f"
+                " (TL=%.2f calib×%.3f) → cloud %.1f%%",
+                input_label,
+                value,
+                ghi,
+                earth_sun_factor,
+                calibrated_clear_sky,
+                tl,
+                calibration,
+                round(cloud_cover, 1),
+            )
+        if cloud_cover < 0.0:
+            cloud_cover = 0.0
+        elif cloud_cover > 100.0:
+            cloud_cover = 100.0
 
         # Cross-validate: when local lux indicates clear sky but external
         # weather reports heavy cloud or fog, flag the disagreement.
@@ -1235,12 +1636,13 @@ class SagerWeathercasterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             and self._ext_weather_data.current_cloud_cover is not None
             and self._ext_weather_data.current_cloud_cover > 60.0
         ):
-            _LOGGER.debug(
-                "Local lux indicates clear sky (%.0f%%) but external weather"
-                " reports %.0f%% cloud cover — trusting local sensors",
-                cloud_cover,
-                self._ext_weather_data.current_cloud_cover,
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Local lux indicates clear sky (%.0f%%) but external weather"
+                    " reports %.0f%% cloud cover — trusting local sensors",
+                    cloud_cover,
+                    self._ext_weather_data.current_cloud_cover,
+                )
             self._ext_weather_disagreement = True
         else:
             self._ext_weather_disagreement = False
@@ -1272,7 +1674,7 @@ class SagerWeathercasterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     def _update_forecast_snapshot(
         self,
         sensor_data: dict[str, Any],
-        forecast: dict[str, Any],
+        forecast: SagerResult,
     ) -> None:
         """Verify pending forecast if mature; store current forecast as new pending.
 
@@ -1311,18 +1713,18 @@ class SagerWeathercasterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
     def _store_pending_snapshot(
         self,
-        forecast: dict[str, Any],
+        forecast: SagerResult,
         now: datetime,
     ) -> None:
         """Replace the pending snapshot with the current forecast."""
-        forecast_code = forecast.get("forecast_code", "")
+        forecast_code = forecast.forecast_code
         condition = FORECAST_CONDITIONS.get(forecast_code, "")
         self._pending_snapshot = {
             "timestamp": now.isoformat(),
             "forecast_code": forecast_code,
-            "cloud_level": forecast.get("cloud_level", CLOUD_LEVEL_CLEAR),
+            "cloud_level": forecast.cloud_level,
             "is_rain_predicted": condition in _RAIN_CONDITIONS,
-            "confidence": forecast.get("confidence", 0),
+            "confidence": forecast.confidence,
         }
 
     def _run_verification(
@@ -1409,6 +1811,9 @@ class SagerWeathercasterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         manual = self._initial_calib_factor
         if manual is not None and manual != 1.0 and 0.4 <= manual <= 1.4:
             self._sky_calibration_factor = manual
+            # Only EMA refinements of the seed are worth persisting; the seed
+            # itself must never overwrite the stored EMA value.
+            self._persisted_calibration_factor = manual
             _LOGGER.debug(
                 "Sky calibration seeded from config option: %.3f (storage bypassed)",
                 manual,
@@ -1421,18 +1826,57 @@ class SagerWeathercasterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             factor = data.get("sky_calibration_factor")
             if isinstance(factor, float) and 0.4 <= factor <= 1.4:
                 self._sky_calibration_factor = factor
+                self._persisted_calibration_factor = factor
                 _LOGGER.debug(
                     "Sky calibration factor restored from storage: %.3f", factor
                 )
         self._calibration_loaded = True
 
-    async def _async_save_calibration(self) -> None:
-        """Persist the sky calibration factor to storage."""
-        await self._store.async_save(
-            {"sky_calibration_factor": self._sky_calibration_factor}
+    @callback
+    def _async_schedule_calibration_save(self) -> None:
+        """Schedule a delayed write of the sky calibration factor.
+
+        Store.async_delay_save coalesces every EMA update made within
+        CALIBRATION_SAVE_DELAY_SECONDS into a single write (and flushes on
+        HA shutdown), so clear-sky learning windows do not hit the disk on
+        every coordinator tick.
+
+        Changes smaller than CALIBRATION_SAVE_MIN_DELTA relative to the last
+        persisted factor are skipped; they accumulate until they cross it.
+        """
+        if (
+            abs(self._sky_calibration_factor - self._persisted_calibration_factor)
+            <= CALIBRATION_SAVE_MIN_DELTA
+        ):
+            return
+        self._calibration_dirty = True
+        self._store.async_delay_save(
+            self._calibration_data_to_save, CALIBRATION_SAVE_DELAY_SECONDS
         )
 
-    def _calculate_reliability(self, sensor_data: dict[str, Any]) -> dict[str, Any]:
+    async def async_shutdown(self) -> None:
+        """Cancel refreshes and flush a pending calibration write on unload.
+
+        A reload would otherwise leave the delayed save from
+        _async_schedule_calibration_save() queued on this (now discarded)
+        coordinator's store, where it could fire after the new coordinator
+        has loaded or written the same file.  Store.async_save() cancels the
+        queued delayed write before writing.
+        """
+        await super().async_shutdown()
+        if self._calibration_dirty:
+            await self._store.async_save(self._calibration_data_to_save())
+
+    @callback
+    def _calibration_data_to_save(self) -> dict[str, float]:
+        """Return the calibration payload written by the store."""
+        self._persisted_calibration_factor = self._sky_calibration_factor
+        self._calibration_dirty = False
+        return {"sky_calibration_factor": self._sky_calibration_factor}
+
+    def _calculate_reliability(
+        self, sensor_data: dict[str, Any], input_status: dict[str, str]
+    ) -> dict[str, Any]:
         """Calculate forecast reliability as a percentage (0-100).
 
         Reliability is based on how many critical input sensors are
@@ -1441,30 +1885,18 @@ class SagerWeathercasterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         Wind historic and pressure change now come from the recorder
         rather than user-configured helper sensors.
 
+        `input_status` is the per-input status from _get_sensor_data().
+
         Returns a dict with score and per-sensor status details.
         """
-        # (config_key, label, weight) - entity-based checks sum to 60 pts
-        critical_entities: list[tuple[str, str, int]] = [
-            (CONF_PRESSURE_ENTITY, "pressure", 20),
-            (CONF_WIND_DIR_ENTITY, "wind_direction", 15),
-            (CONF_WIND_SPEED_ENTITY, "wind_speed", 10),
-            (CONF_CLOUD_COVER_ENTITY, "cloud_cover", 15),
-        ]
-
         score = 0
         sensor_status: dict[str, str] = {}
 
-        for config_key, label, weight in critical_entities:
-            entity_id = self.config_data.get(config_key)
-            if not entity_id:
-                sensor_status[label] = "not configured"
-                continue
-            state = self.hass.states.get(entity_id)
-            if state and state.state not in ("unavailable", "unknown", "none"):
+        for label, weight in _CRITICAL_ENTITIES:
+            status = input_status[label]
+            sensor_status[label] = status
+            if status == "ok":
                 score += weight
-                sensor_status[label] = "ok"
-            else:
-                sensor_status[label] = "unavailable"
 
         # Recorder-computed fields: available once the integration has accumulated
         # ALGORITHM_WINDOW_HOURS of history (typically after the first 6h of use).
@@ -1503,33 +1935,35 @@ class SagerWeathercasterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         if change_3h < -ZAMBRETTI_TREND_THRESHOLD:
             trend = "falling"
-            forecast_idx = math.floor(
-                ZAMBRETTI_FALLING_CONSTANT - ZAMBRETTI_FALLING_FACTOR * pressure
-            )
-            forecast_idx = max(1, min(9, forecast_idx))
+            table = _Z_FALLING
+            lo, hi = _Z_FALLING_BOUNDS
+            raw_idx = ZAMBRETTI_FALLING_CONSTANT - ZAMBRETTI_FALLING_FACTOR * pressure
         elif change_3h > ZAMBRETTI_TREND_THRESHOLD:
             trend = "rising"
-            forecast_idx = math.floor(
-                ZAMBRETTI_RISING_CONSTANT - ZAMBRETTI_RISING_FACTOR * pressure
-            )
-            forecast_idx = max(20, min(32, forecast_idx))
+            table = _Z_RISING
+            lo, hi = _Z_RISING_BOUNDS
+            raw_idx = ZAMBRETTI_RISING_CONSTANT - ZAMBRETTI_RISING_FACTOR * pressure
         else:
             trend = "steady"
-            forecast_idx = math.floor(
-                ZAMBRETTI_STEADY_CONSTANT - ZAMBRETTI_STEADY_FACTOR * pressure
-            )
-            forecast_idx = max(10, min(19, forecast_idx))
+            table = _Z_STEADY
+            lo, hi = _Z_STEADY_BOUNDS
+            raw_idx = ZAMBRETTI_STEADY_CONSTANT - ZAMBRETTI_STEADY_FACTOR * pressure
+
+        # int() truncates toward zero rather than flooring, but every lower
+        # bound is >= 1 so negative values clamp to the same index either way
+        forecast_idx = max(lo, min(hi, int(raw_idx)))
 
-        # Wind direction adjustment (N=0, E/W=+1, S=+2)
+        # Wind direction adjustment (N=0, E/W=+1, S=+2).  Folding the bearing
+        # onto 0-180° makes the sectors symmetric about the N-S axis, so one
+        # bisect over the folded sector edges picks the adjustment.
         wind_dir = sensor_data.get("wind_direction", 0)
-        if 135 <= wind_dir <= 225:  # South-ish
-            forecast_idx = min(forecast_idx + 2, max(ZAMBRETTI_FORECASTS[trend]))
-        elif 45 <= wind_dir < 135 or 225 < wind_dir <= 315:  # East or West
-            forecast_idx = min(forecast_idx + 1, max(ZAMBRETTI_FORECASTS[trend]))
-
-        lookup = ZAMBRETTI_FORECASTS.get(trend, {})
-        if forecast_idx in lookup:
-            zambretti_key, condition = lookup[forecast_idx]
+        folded_dir = min(wind_dir, 360 - wind_dir)
+        sector = bisect.bisect_right(_ZAMBRETTI_WIND_EDGES, folded_dir)
+        forecast_idx = min(forecast_idx + sector, hi)
+
+        entry = table[forecast_idx]
+        if entry is not None:
+            zambretti_key, condition = entry
         else:
             zambretti_key = "unknown"
             condition = "partlycloudy"
@@ -1542,47 +1976,26 @@ class SagerWeathercasterCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         }
 
     def _cross_validate(
-        self, forecast: dict[str, Any], zambretti: dict[str, Any]
-    ) -> dict[str, Any]:
+        self, forecast: SagerResult, zambretti: dict[str, Any]
+    ) -> SagerResult:
         """Cross-validate Sager and Zambretti forecasts.
 
         Adjusts confidence based on agreement between the two algorithms.
         """
-        sager_code = forecast.get("forecast_code", "d")
-        sager_condition = FORECAST_CONDITIONS.get(sager_code, "partlycloudy")
+        sager_condition = FORECAST_CONDITIONS.get(
+            forecast.forecast_code, "partlycloudy"
+        )
         zambretti_condition = zambretti.get("condition", "partlycloudy")
 
-        # Severity ranking for comparison
-        severity = {
-            "sunny": 0,
-            "clear-night": 0,
-            "partlycloudy": 1,
-            "cloudy": 2,
-            "rainy": 3,
-            "snowy": 3,
-            "pouring": 4,
-        }
-        sager_sev = severity.get(sager_condition, 1)
-        zambretti_sev = severity.get(zambretti_condition, 1)
-
-        base_confidence = forecast.get("confidence", 80)
-        diff = abs(sager_sev - zambretti_sev)
-
-        if diff == 0:
-            # Perfect agreement: boost confidence
-            forecast["confidence"] = min(base_confidence + 10, 99)
-            forecast["cross_validation"] = "agree"
-        elif diff == 1:
-            # Close agreement: keep confidence
-            forecast["cross_validation"] = "close"
-        elif diff == 2:
-            # Moderate disagreement: reduce confidence slightly
-            forecast["confidence"] = max(base_confidence - 10, 40)
-            forecast["cross_validation"] = "diverge"
-        else:
-            # Strong disagreement: significant confidence reduction
-            forecast["confidence"] = max(base_confidence - 20, 30)
-            forecast["cross_validation"] = "conflict"
+        sager_sev = _SEVERITY.get(sager_condition, 1)
+        zambretti_sev = _SEVERITY.get(zambretti_condition, 1)
+
+        # Severities span 0-4, so any difference of 3 or more is a conflict
+        label, delta, floor, ceiling = _CONF_ADJUST[
+            min(abs(sager_sev - zambretti_sev), 3)
+        ]
+        forecast.confidence = max(floor, min(ceiling, forecast.confidence + delta))
+        forecast.cross_validation = label
 
-        forecast["zambretti_condition"] = zambretti_condition
+        forecast.zambretti_condition = zambretti_condition
         return forecast
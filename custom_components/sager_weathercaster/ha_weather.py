@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass, field
+import functools
 import logging
 from typing import Any
 
@@ -20,7 +22,7 @@ _FORECAST_DAILY = WeatherEntityFeature.FORECAST_DAILY
 _FORECAST_TWICE_DAILY = WeatherEntityFeature.FORECAST_TWICE_DAILY
 
 
-@dataclass
+@dataclass(slots=True)
 class ExternalWeatherHourlyEntry:
     """One hourly forecast slot from an external HA weather entity.
 
@@ -52,7 +54,7 @@ class ExternalWeatherHourlyEntry:
     is_day: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class ExternalWeatherDailyEntry:
     """One daily forecast slot from an external HA weather entity."""
 
@@ -69,7 +71,7 @@ class ExternalWeatherDailyEntry:
     uv_index_max: float | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ExternalWeatherData:
     """Aggregated data returned by HAWeatherClient."""
 
@@ -83,69 +85,88 @@ class ExternalWeatherData:
 
 def _is_day_from_hour(dt_str: str) -> bool:
     """Return True when the ISO datetime string falls within 06:00–20:59 local hour."""
-    try:
-        # datetime strings are either "YYYY-MM-DDTHH:MM:SS[+tz]" or "YYYY-MM-DDTHH:MM"
-        hour = int(dt_str[11:13])
-    except (IndexError, ValueError):
+    # datetime strings are either "YYYY-MM-DDTHH:MM:SS[+tz]" or "YYYY-MM-DDTHH:MM"
+    hour_text = dt_str[11:13]
+    if not hour_text.isdecimal():
         return True  # default to daytime on parse failure
-    else:
-        return 6 <= hour <= 20
+    return 6 <= int(hour_text) <= 20
+
+
+# (dataclass field, HA forecast key) pairs copied verbatim into each entry.
+_HOURLY_FIELD_MAP: tuple[tuple[str, str], ...] = (
+    ("temperature", "native_temperature"),
+    ("humidity", "humidity"),
+    ("dew_point", "native_dew_point"),
+    ("apparent_temperature", "native_apparent_temperature"),
+    ("precipitation_probability", "precipitation_probability"),
+    ("precipitation", "native_precipitation"),
+    ("condition", "condition"),
+    ("cloud_cover", "cloud_coverage"),
+    ("wind_speed", "native_wind_speed"),
+    ("wind_direction", "wind_bearing"),
+    ("wind_gusts", "native_wind_gust_speed"),
+    ("uv_index", "uv_index"),
+)
+_DAILY_FIELD_MAP: tuple[tuple[str, str], ...] = (
+    ("condition", "condition"),
+    ("temperature_max", "native_temperature"),
+    ("temperature_min", "native_templow"),
+    ("precipitation_sum", "native_precipitation"),
+    ("precipitation_probability_max", "precipitation_probability"),
+    ("wind_speed_max", "native_wind_speed"),
+    ("wind_direction_dominant", "wind_bearing"),
+    ("cloud_cover_mean", "cloud_coverage"),
+    ("uv_index_max", "uv_index"),
+)
+
+
+def _forecast_is_day(fc: dict[str, Any], dt: str) -> bool:
+    """Return the day/night flag of one hourly forecast dict."""
+    # is_daytime is present in twice_daily forecasts; derive from hour otherwise.
+    is_daytime = fc.get("is_daytime")
+    return bool(is_daytime) if is_daytime is not None else _is_day_from_hour(dt)
 
 
 def _parse_hourly(forecast_list: list[dict[str, Any]]) -> list[ExternalWeatherHourlyEntry]:
     """Convert a list of HA forecast dicts to ExternalWeatherHourlyEntry objects."""
-    entries: list[ExternalWeatherHourlyEntry] = []
-    for fc in forecast_list:
-        dt = fc.get("datetime", "")
-        if not dt:
-            continue
-        # is_daytime is present in twice_daily forecasts; derive from hour otherwise.
-        is_daytime = fc.get("is_daytime")
-        is_day = bool(is_daytime) if is_daytime is not None else _is_day_from_hour(dt)
-
-        entries.append(
-            ExternalWeatherHourlyEntry(
-                datetime=dt,
-                temperature=fc.get("native_temperature"),
-                humidity=fc.get("humidity"),
-                dew_point=fc.get("native_dew_point"),
-                apparent_temperature=fc.get("native_apparent_temperature"),
-                precipitation_probability=fc.get("precipitation_probability"),
-                precipitation=fc.get("native_precipitation"),
-                condition=fc.get("condition"),
-                cloud_cover=fc.get("cloud_coverage"),
-                wind_speed=fc.get("native_wind_speed"),
-                wind_direction=fc.get("wind_bearing"),
-                wind_gusts=fc.get("native_wind_gust_speed"),
-                uv_index=fc.get("uv_index"),
-                is_day=is_day,
-            )
+    return [
+        ExternalWeatherHourlyEntry(
+            datetime=dt,
+            is_day=_forecast_is_day(fc, dt),
+            **{attr: fc.get(key) for attr, key in _HOURLY_FIELD_MAP},
         )
-    return entries
+        for fc in forecast_list
+        if (dt := fc.get("datetime"))
+    ]
 
 
 def _parse_daily(forecast_list: list[dict[str, Any]]) -> list[ExternalWeatherDailyEntry]:
     """Convert a list of HA daily forecast dicts to ExternalWeatherDailyEntry objects."""
-    entries: list[ExternalWeatherDailyEntry] = []
-    for fc in forecast_list:
-        dt = fc.get("datetime", "")
-        if not dt:
-            continue
-        entries.append(
-            ExternalWeatherDailyEntry(
-                datetime=dt,
-                condition=fc.get("condition"),
-                temperature_max=fc.get("native_temperature"),
-                temperature_min=fc.get("native_templow"),
-                precipitation_sum=fc.get("native_precipitation"),
-                precipitation_probability_max=fc.get("precipitation_probability"),
-                wind_speed_max=fc.get("native_wind_speed"),
-                wind_direction_dominant=fc.get("wind_bearing"),
-                cloud_cover_mean=fc.get("cloud_coverage"),
-                uv_index_max=fc.get("uv_index"),
-            )
+    return [
+        ExternalWeatherDailyEntry(
+            datetime=dt, **{attr: fc.get(key) for attr, key in _DAILY_FIELD_MAP}
         )
-    return entries
+        for fc in forecast_list
+        if (dt := fc.get("datetime"))
+    ]
+
+
+@functools.lru_cache(maxsize=8)
+def _forecast_plan(supported: int) -> tuple[str | None, bool]:
+    """Return (hourly forecast type or None, fetch daily) for a feature mask.
+
+    Cached on the mask itself, so an entity that changes its supported
+    features is planned afresh on the next fetch.
+    """
+    # --- Hourly (prefer true hourly; fall back to twice-daily) ---
+    hourly_type: str | None = None
+    if supported & _FORECAST_HOURLY:
+        hourly_type = "hourly"
+    elif supported & _FORECAST_TWICE_DAILY:
+        hourly_type = "twice_daily"
+
+    # --- Daily ---
+    return hourly_type, bool(supported & _FORECAST_DAILY)
 
 
 class HAWeatherClient:
@@ -155,6 +176,8 @@ class HAWeatherClient:
         """Initialise the client for the given weather entity."""
         self._hass = hass
         self._entity_id = entity_id
+        # Service-call target, shared by every weather.get_forecasts call.
+        self._target: dict[str, str] = {"entity_id": entity_id}
 
     async def async_get_data(self) -> ExternalWeatherData | None:
         """Fetch current state and forecasts from the weather entity.
@@ -176,27 +199,39 @@ class HAWeatherClient:
         current_cloud: int | None = attrs.get("cloud_coverage")
         attribution: str | None = attrs.get("attribution")
 
-        supported: int = attrs.get("supported_features", 0)
+        hourly_type, want_daily = _forecast_plan(attrs.get("supported_features", 0))
 
         hourly_entries: list[ExternalWeatherHourlyEntry] = []
         daily_entries: list[ExternalWeatherDailyEntry] = []
 
-        # --- Hourly (prefer true hourly; fall back to twice-daily) ---
-        if supported & _FORECAST_HOURLY:
-            hourly_entries = await self._fetch_forecast("hourly")
-        elif supported & _FORECAST_TWICE_DAILY:
-            hourly_entries = await self._fetch_forecast("twice_daily")
-
-        # --- Daily ---
-        if supported & _FORECAST_DAILY:
+        # The two service calls are independent, so issue them concurrently.
+        # Both fetch helpers catch their own errors and return [], so one
+        # failing call never discards the other's result.  Anything that
+        # still escapes a helper is re-raised unchanged once both calls have
+        # finished, just as when they ran one after the other.
+        if hourly_type is not None and want_daily:
+            hourly_result, daily_result = await asyncio.gather(
+                self._fetch_forecast(hourly_type),
+                self._fetch_daily(),
+                return_exceptions=True,
+            )
+            if isinstance(hourly_result, BaseException):
+                raise hourly_result
+            if isinstance(daily_result, BaseException):
+                raise daily_result
+            hourly_entries, daily_entries = hourly_result, daily_result
+        elif hourly_type is not None:
+            hourly_entries = await self._fetch_forecast(hourly_type)
+        elif want_daily:
             daily_entries = await self._fetch_daily()
 
-        _LOGGER.debug(
-            "External weather data fetched from %s: %d hourly, %d daily entries",
-            self._entity_id,
-            len(hourly_entries),
-            len(daily_entries),
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "External weather data fetched from %s: %d hourly, %d daily entries",
+                self._entity_id,
+                len(hourly_entries),
+                len(daily_entries),
+            )
 
         return ExternalWeatherData(
             hourly=hourly_entries,
@@ -207,6 +242,14 @@ class HAWeatherClient:
 
     async def _fetch_forecast(self, forecast_type: str) -> list[ExternalWeatherHourlyEntry]:
         """Call weather.get_forecasts and parse the response as hourly entries."""
+        return _parse_hourly(await self._async_get_forecast_list(forecast_type))
+
+    async def _fetch_daily(self) -> list[ExternalWeatherDailyEntry]:
+        """Call weather.get_forecasts for daily data and parse the response."""
+        return _parse_daily(await self._async_get_forecast_list("daily"))
+
+    async def _async_get_forecast_list(self, forecast_type: str) -> list[dict[str, Any]]:
+        """Call weather.get_forecasts and return the raw forecast dicts (or [])."""
         try:
             response: dict[str, Any] | None = await self._hass.services.async_call(
                 WEATHER_DOMAIN,
@@ -214,7 +257,7 @@ class HAWeatherClient:
                 {"type": forecast_type},
                 blocking=True,
                 return_response=True,
-                target={"entity_id": self._entity_id},
+                target=self._target,
             )
         except Exception:  # noqa: BLE001
             # weather.get_forecasts is handled by arbitrary third-party
@@ -228,32 +271,7 @@ class HAWeatherClient:
             )
             return []
 
-        forecast_list: list[dict[str, Any]] = (
-            (response or {}).get(self._entity_id, {}).get("forecast") or []
-        )
-        return _parse_hourly(forecast_list)
-
-    async def _fetch_daily(self) -> list[ExternalWeatherDailyEntry]:
-        """Call weather.get_forecasts for daily data and parse the response."""
-        try:
-            response: dict[str, Any] | None = await self._hass.services.async_call(
-                WEATHER_DOMAIN,
-                "get_forecasts",
-                {"type": "daily"},
-                blocking=True,
-                return_response=True,
-                target={"entity_id": self._entity_id},
-            )
-        except Exception:  # noqa: BLE001
-            # Same broad-catch rationale as _fetch_forecast.
-            _LOGGER.debug(
-                "Failed to fetch daily forecast from %s",
-                self._entity_id,
-                exc_info=True,
-            )
+        entity_response = response.get(self._entity_id) if response else None
+        if not entity_response:
             return []
-
-        forecast_list: list[dict[str, Any]] = (
-            (response or {}).get(self._entity_id, {}).get("forecast") or []
-        )
-        return _parse_daily(forecast_list)
+        return entity_response.get("forecast") or []
@@ -5008,3 +5008,23 @@ SAGER_TABLE: dict[str, str] = {
     "Z855": "PW97",
 }
 # fmt: on
+
+
+def sager_table_index(wind_letter: str, hpa: int, trend: int, cloud: int) -> int:
+    """Return the flat SAGER_TABLE_INDEXED slot for a Sager lookup key.
+
+    Mixed-radix packing of letter (A–Z) × hpa level (1–8) × pressure trend
+    (1–5) × cloud level (1–5); every in-range combination maps to a unique
+    slot, so no string key has to be built for the lookup.
+    """
+    return (((ord(wind_letter) - 65) * 8 + hpa - 1) * 5 + trend - 1) * 5 + cloud - 1
+
+
+# Same data as SAGER_TABLE, laid out as a list indexed by sager_table_index().
+# Slots for unused letters (e.g. "I") hold None.
+SAGER_TABLE_INDEXED: list[str | None] = [None] * (26 * 8 * 5 * 5)
+for _key, _value in SAGER_TABLE.items():
+    SAGER_TABLE_INDEXED[
+        sager_table_index(_key[0], int(_key[1]), int(_key[2]), int(_key[3]))
+    ] = _value
+del _key, _value
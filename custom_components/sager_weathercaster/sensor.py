@@ -32,7 +32,7 @@ from .const import (
     MODEL,
     VERSION,
 )
-from .coordinator import SagerWeathercasterCoordinator
+from .coordinator import SagerResult, SagerWeathercasterCoordinator
 
 PARALLEL_UPDATES = 0
 
@@ -90,8 +90,8 @@ class SagerSensor(CoordinatorEntity[SagerWeathercasterCoordinator], SensorEntity
         if not self.coordinator.data:
             return None
 
-        forecast = self.coordinator.data.get("forecast", {})
-        return cast("str | None", forecast.get("forecast_code"))
+        forecast: SagerResult | None = self.coordinator.data.get("forecast")
+        return forecast.forecast_code if forecast is not None else None
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
@@ -99,29 +99,34 @@ class SagerSensor(CoordinatorEntity[SagerWeathercasterCoordinator], SensorEntity
         if not self.coordinator.data:
             return {}
 
-        forecast = self.coordinator.data.get("forecast", {})
+        forecast: SagerResult | None = self.coordinator.data.get("forecast")
+        if forecast is None:
+            return {}
         sensor_data = self.coordinator.data.get("sensor_data", {})
         zambretti = self.coordinator.data.get("zambretti", {})
 
         pressure_change = sensor_data.get("pressure_change")
         wind_historic = sensor_data.get("wind_historic")
         cloud_cover_raw = sensor_data.get("cloud_cover")
+        # "YYYY-MM-DD HH:MM:SS" local time; tzinfo is dropped so isoformat
+        # appends no UTC offset.
+        last_update = dt_util.now().replace(tzinfo=None).isoformat(" ", "seconds")
 
         return {
-            ATTR_PRESSURE_LEVEL: forecast.get("hpa_level"),
+            ATTR_PRESSURE_LEVEL: forecast.hpa_level,
             ATTR_PRESSURE_CHANGE_6H: round(pressure_change, 1)
             if pressure_change is not None
             else None,
-            ATTR_WIND_TREND: forecast.get("wind_trend"),
+            ATTR_WIND_TREND: forecast.wind_trend,
             ATTR_WIND_DIRECTION_6H_AGO: wind_historic,
-            ATTR_CLOUD_LEVEL: forecast.get("cloud_level"),
-            ATTR_PRESSURE_TREND: forecast.get("pressure_trend"),
-            ATTR_CONFIDENCE: forecast.get("confidence"),
-            "wind_velocity": forecast.get("wind_velocity_key"),
-            "wind_direction": forecast.get("wind_direction_key"),
-            "latitude_zone": forecast.get("latitude_zone"),
-            "cross_validation": forecast.get("cross_validation"),
-            "zambretti_condition": forecast.get("zambretti_condition"),
+            ATTR_CLOUD_LEVEL: forecast.cloud_level,
+            ATTR_PRESSURE_TREND: forecast.pressure_trend,
+            ATTR_CONFIDENCE: forecast.confidence,
+            "wind_velocity": forecast.wind_velocity_key,
+            "wind_direction": forecast.wind_direction_key,
+            "latitude_zone": forecast.latitude_zone,
+            "cross_validation": forecast.cross_validation,
+            "zambretti_condition": forecast.zambretti_condition,
             "zambretti_forecast": zambretti.get("zambretti_key"),
             "cloud_cover": round(cloud_cover_raw, 1)
             if cloud_cover_raw is not None
@@ -130,7 +135,7 @@ class SagerSensor(CoordinatorEntity[SagerWeathercasterCoordinator], SensorEntity
                 self.coordinator.sky_calibration_factor, 3
             ),
             "calibration_seed": self.coordinator.calibration_seed,
-            ATTR_LAST_UPDATE: dt_util.now().strftime("%Y-%m-%d %H:%M:%S"),
+            ATTR_LAST_UPDATE: last_update,
         }
 
 
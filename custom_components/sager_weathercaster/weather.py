@@ -64,7 +64,7 @@ from .const import (
     WIND_SPEED_WINDY_THRESHOLD,
     WMO_TO_HA_CONDITION,
 )
-from .coordinator import SagerWeathercasterCoordinator
+from .coordinator import SagerResult, SagerWeathercasterCoordinator
 from .ha_weather import ExternalWeatherDailyEntry, ExternalWeatherHourlyEntry
 from .wind_names import get_named_wind, get_named_wind_from_degrees
 
@@ -332,27 +332,29 @@ class SagerWeatherEntity(
         if not self.coordinator.data:
             return {}
 
-        forecast = self.coordinator.data.get("forecast", {})
+        forecast: SagerResult | None = self.coordinator.data.get("forecast")
+        if forecast is None:
+            return {}
         zambretti = self.coordinator.data.get("zambretti", {})
         ext_weather = self.coordinator.data.get("ext_weather", {})
         sensor_data = self.coordinator.data.get("sensor_data", {})
 
         pressure_change = sensor_data.get("pressure_change")
         attrs: dict[str, Any] = {
-            ATTR_SAGER_FORECAST: forecast.get("forecast_code"),
-            ATTR_PRESSURE_LEVEL: forecast.get("hpa_level"),
+            ATTR_SAGER_FORECAST: forecast.forecast_code,
+            ATTR_PRESSURE_LEVEL: forecast.hpa_level,
             ATTR_PRESSURE_CHANGE_6H: round(pressure_change, 1)
             if pressure_change is not None
             else None,
-            ATTR_WIND_TREND: forecast.get("wind_trend"),
-            ATTR_PRESSURE_TREND: forecast.get("pressure_trend"),
-            ATTR_CLOUD_LEVEL: forecast.get("cloud_level"),
-            ATTR_CONFIDENCE: forecast.get("confidence"),
-            "wind_velocity": forecast.get("wind_velocity_key"),
-            "wind_direction": forecast.get("wind_direction_key"),
-            "latitude_zone": forecast.get("latitude_zone"),
-            "cross_validation": forecast.get("cross_validation"),
-            "zambretti_condition": forecast.get("zambretti_condition"),
+            ATTR_WIND_TREND: forecast.wind_trend,
+            ATTR_PRESSURE_TREND: forecast.pressure_trend,
+            ATTR_CLOUD_LEVEL: forecast.cloud_level,
+            ATTR_CONFIDENCE: forecast.confidence,
+            "wind_velocity": forecast.wind_velocity_key,
+            "wind_direction": forecast.wind_direction_key,
+            "latitude_zone": forecast.latitude_zone,
+            "cross_validation": forecast.cross_validation,
+            "zambretti_condition": forecast.zambretti_condition,
             "zambretti_forecast": zambretti.get("zambretti_key"),
             "external_weather_available": ext_weather.get("available", False),
         }
@@ -363,7 +365,7 @@ class SagerWeatherEntity(
         wind_deg = sensor_data.get("wind_direction")
         if wind_deg is not None:
             attrs["current_wind_name"] = get_named_wind_from_degrees(lat, lon, wind_deg)
-        forecast_wind_dir = forecast.get("wind_dir")
+        forecast_wind_dir = forecast.wind_dir
         if forecast_wind_dir:
             attrs["forecast_wind_name"] = get_named_wind(lat, lon, forecast_wind_dir)
 
@@ -372,7 +374,7 @@ class SagerWeatherEntity(
             api_daily: list[ExternalWeatherDailyEntry] = ext_weather.get("daily", [])
             if api_daily:
                 sager_cond = FORECAST_CONDITIONS.get(
-                    forecast.get("forecast_code", "d"), "partlycloudy"
+                    forecast.forecast_code, "partlycloudy"
                 )
                 ext_cond = (
                     api_daily[0].condition
@@ -392,7 +394,9 @@ class SagerWeatherEntity(
         if not self.coordinator.data:
             return None
 
-        forecast = self.coordinator.data.get("forecast", {})
+        forecast: SagerResult | None = self.coordinator.data.get("forecast")
+        if forecast is None:
+            return None
         ext_weather = self.coordinator.data.get("ext_weather", {})
         try:
             return self._generate_daily_forecast(forecast, ext_weather)
@@ -412,7 +416,9 @@ class SagerWeatherEntity(
         if not self.coordinator.data:
             return None
 
-        forecast = self.coordinator.data.get("forecast", {})
+        forecast: SagerResult | None = self.coordinator.data.get("forecast")
+        if forecast is None:
+            return None
         sensor_data = self.coordinator.data.get("sensor_data", {})
         ext_weather = self.coordinator.data.get("ext_weather", {})
 
@@ -440,7 +446,7 @@ class SagerWeatherEntity(
 
     def _generate_daily_forecast(
         self,
-        sager_result: dict[str, Any],
+        sager_result: SagerResult,
         ext_weather: dict[str, Any],
     ) -> list[Forecast]:
         """Generate 7-day daily forecast with Sager-primary conditions.
@@ -453,7 +459,7 @@ class SagerWeatherEntity(
         """
         now = dt_util.utcnow()
         base_temp = self.native_temperature or 15.0
-        forecast_code = sager_result.get("forecast_code", "d")
+        forecast_code = sager_result.forecast_code
 
         # Day 1 condition and precipitation probability
         condition_p1 = FORECAST_CONDITIONS.get(forecast_code, "partlycloudy")
@@ -632,7 +638,7 @@ class SagerWeatherEntity(
 
     def _generate_sager_hourly_forecast(
         self,
-        sager_result: dict[str, Any],
+        sager_result: SagerResult,
         sensor_data: dict[str, Any],
     ) -> list[Forecast]:
         """Generate Sager-primary hourly forecast for the next 48 hours.
@@ -651,7 +657,7 @@ class SagerWeatherEntity(
         now = dt_util.utcnow()
 
         # Sager condition codes for the two 24h periods
-        forecast_code = sager_result.get("forecast_code", "d")
+        forecast_code = sager_result.forecast_code
         condition_p1 = FORECAST_CONDITIONS.get(forecast_code, "partlycloudy")
         precip_p1 = PRECIPITATION_PROBABILITY.get(condition_p1, 15.0)
 
@@ -682,13 +688,10 @@ class SagerWeatherEntity(
         current_humidity: float | None = self._get_sensor_float(CONF_HUMIDITY_ENTITY)
 
         # Sager signals for extrapolation
-        wind_velocity_key: str = sager_result.get(
-            "wind_velocity_key", "no_significant_change"
-        )
+        wind_velocity_key = sager_result.wind_velocity_key
 
         # Target cloud cover per period
-        cloud_level_str: str = sager_result.get("cloud_level", "Partly Cloudy")
-        target_cloud_p1 = _CLOUD_LEVEL_TO_PERCENT.get(cloud_level_str, 50.0)
+        target_cloud_p1 = _CLOUD_LEVEL_TO_PERCENT.get(sager_result.cloud_level, 50.0)
         target_cloud_p2 = _CONDITION_TO_CLOUD.get(condition_p2, 50.0)
 
         # Target humidity per period
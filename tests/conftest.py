@@ -15,6 +15,7 @@ from custom_components.sager_weathercaster.const import (
     CONF_WIND_DIR_ENTITY,
     DOMAIN,
 )
+from custom_components.sager_weathercaster.coordinator import SagerResult
 
 # Point hass at the real config/ directory so it can find the custom component.
 # config/custom_components/sager_weathercaster/ is the live integration directory.
@@ -48,20 +49,21 @@ MOCK_COORDINATOR_DATA: dict = {
         "temperature": 18.0,
         "humidity": 55.0,
     },
-    "forecast": {
-        "forecast_code": "a",
-        "hpa_level": 2,
-        "wind_dir": "W",
-        "wind_trend": "STEADY",
-        "cloud_level": "Clear",
-        "pressure_trend": "Rising Slowly",
-        "confidence": 80.0,
-        "wind_velocity_key": "no_significant_change",
-        "wind_direction_key": "w_or_nw",
-        "latitude_zone": "Northern Temperate",
-        "cross_validation": "agree",
-        "zambretti_condition": "sunny",
-    },
+    "forecast": SagerResult(
+        forecast_code="a",
+        wind_velocity_key="no_significant_change",
+        wind_direction_key="w_or_nw",
+        hpa_level=2,
+        wind_dir="W",
+        wind_trend="STEADY",
+        pressure_trend="Rising Slowly",
+        cloud_level="Clear",
+        confidence=80,
+        latitude_zone="Northern Temperate",
+        sager_letter="U",
+        cross_validation="agree",
+        zambretti_condition="sunny",
+    ),
     "zambretti": {
         "zambretti_key": "settled_fine",
         "condition": "sunny",
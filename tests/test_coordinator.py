@@ -0,0 +1,299 @@
+"""Tests for the Sager Weathercaster data update coordinator."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import math
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from homeassistant.core import HomeAssistant, State
+from homeassistant.util import dt as dt_util
+
+from tests.common import MockConfigEntry
+
+from custom_components.sager_weathercaster.const import (
+    CONF_INITIAL_CALIBRATION_FACTOR,
+    CONF_TEMPERATURE_ENTITY,
+    CONF_WEATHER_ENTITY,
+    CONF_WIND_SPEED_ENTITY,
+    DOMAIN,
+)
+from custom_components.sager_weathercaster.coordinator import (
+    SagerWeathercasterCoordinator,
+)
+from custom_components.sager_weathercaster.ha_weather import ExternalWeatherData
+
+from .conftest import MOCK_PRESSURE_ENTITY, MOCK_WIND_DIR_ENTITY
+
+MOCK_TEMPERATURE_ENTITY = "sensor.mock_temperature"
+MOCK_WIND_SPEED_ENTITY = "sensor.mock_wind_speed"
+MOCK_WEATHER_ENTITY = "weather.mock_weather"
+
+
+def _make_coordinator(
+    hass: HomeAssistant,
+    data: dict | None = None,
+    options: dict | None = None,
+) -> SagerWeathercasterCoordinator:
+    """Return a coordinator for a MockConfigEntry with the given data/options."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Sager Weather",
+        data={
+            "pressure_entity": MOCK_PRESSURE_ENTITY,
+            "wind_dir_entity": MOCK_WIND_DIR_ENTITY,
+            **(data or {}),
+        },
+        options=options or {},
+        source="user",
+        unique_id=f"{MOCK_PRESSURE_ENTITY}_{MOCK_WIND_DIR_ENTITY}",
+    )
+    entry.add_to_hass(hass)
+    return SagerWeathercasterCoordinator(hass, entry)
+
+
+# ── Sensor input validation ───────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize(
+    ("state", "expected"),
+    [("21.5", 21.5), ("150", 150.0), ("not_a_number", None), ("unavailable", None)],
+)
+async def test_temperature_read_without_range_check(
+    hass: HomeAssistant,
+    caplog: pytest.LogCaptureFixture,
+    state: str,
+    expected: float | None,
+) -> None:
+    """Test that temperature is passed through unclamped and never logged."""
+    coordinator = _make_coordinator(
+        hass, {CONF_TEMPERATURE_ENTITY: MOCK_TEMPERATURE_ENTITY}
+    )
+    hass.states.async_set(MOCK_TEMPERATURE_ENTITY, state)
+
+    data, _ = coordinator._get_sensor_data()
+
+    assert data["temperature"] == expected
+    assert MOCK_TEMPERATURE_ENTITY not in caplog.text
+
+
+# ── Vector wind average ───────────────────────────────────────────────────────
+
+
+def _history(entity_id: str, *readings: tuple[str, datetime]) -> list[State]:
+    """Return recorder-style states for (state, last_changed) pairs."""
+    return [
+        State(entity_id, value, last_changed=changed, last_updated=changed)
+        for value, changed in readings
+    ]
+
+
+async def test_vector_wind_avg_weights_readings_by_duration(
+    hass: HomeAssistant,
+) -> None:
+    """Test that the reading active at the window start counts for its duration.
+
+    North at 10 km/h holds for 8 of the 10 minutes (it began before the
+    window), then east at 20 km/h for the last 2 minutes.
+    """
+    coordinator = _make_coordinator(
+        hass, {CONF_WIND_SPEED_ENTITY: MOCK_WIND_SPEED_ENTITY}
+    )
+    now = dt_util.utcnow()
+    before_window = now - timedelta(minutes=30)
+    changed = now - timedelta(minutes=2)
+    history = {
+        MOCK_WIND_DIR_ENTITY: _history(
+            MOCK_WIND_DIR_ENTITY, ("0", before_window), ("90", changed)
+        ),
+        MOCK_WIND_SPEED_ENTITY: _history(
+            MOCK_WIND_SPEED_ENTITY, ("10", before_window), ("20", changed)
+        ),
+    }
+
+    async def _query(entity_id, start, end, include_start_time_state=True):
+        assert include_start_time_state
+        return history[entity_id]
+
+    with patch.object(
+        coordinator, "_async_query_history", AsyncMock(side_effect=_query)
+    ):
+        mean_dir, mean_speed = await coordinator._async_compute_vector_wind_avg(now)
+
+    assert mean_dir == pytest.approx(math.degrees(math.atan2(2, 8)))
+    assert mean_speed == pytest.approx(12.0)
+
+
+async def test_vector_wind_avg_without_history(hass: HomeAssistant) -> None:
+    """Test that an empty recorder window leaves the live readings in place."""
+    coordinator = _make_coordinator(hass)
+
+    with patch.object(
+        coordinator, "_async_query_history", AsyncMock(return_value=[])
+    ):
+        result = await coordinator._async_compute_vector_wind_avg(dt_util.utcnow())
+
+    assert result == (None, None)
+
+
+# ── Sky calibration persistence ───────────────────────────────────────────────
+
+
+def _calibration_key(coordinator: SagerWeathercasterCoordinator) -> str:
+    """Return the storage key of the coordinator's calibration store."""
+    return f"{DOMAIN}.calibration.{coordinator.config_entry.entry_id}"
+
+
+def _stored_calibration(factor: float) -> dict[str, Any]:
+    """Return a hass_storage payload for the calibration store."""
+    return {
+        "version": 2,
+        "minor_version": 1,
+        "key": "unused",
+        "data": {"sky_calibration_factor": factor},
+    }
+
+
+async def test_manual_calibration_seed_not_persisted(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test that unloading does not write the manual seed over the stored EMA."""
+    coordinator = _make_coordinator(
+        hass, options={CONF_INITIAL_CALIBRATION_FACTOR: 0.8}
+    )
+    key = _calibration_key(coordinator)
+    hass_storage[key] = _stored_calibration(1.2)
+
+    await coordinator._async_load_calibration()
+    assert coordinator.sky_calibration_factor == 0.8
+
+    await coordinator.async_shutdown()
+    await hass.async_block_till_done()
+
+    assert hass_storage[key]["data"] == {"sky_calibration_factor": 1.2}
+
+
+async def test_pending_calibration_save_flushed_on_shutdown(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test that a queued delayed calibration write is flushed on unload."""
+    coordinator = _make_coordinator(hass)
+    key = _calibration_key(coordinator)
+    hass_storage[key] = _stored_calibration(1.2)
+
+    await coordinator._async_load_calibration()
+    coordinator._sky_calibration_factor = 0.9
+    coordinator._async_schedule_calibration_save()
+    assert hass_storage[key]["data"] == {"sky_calibration_factor": 1.2}
+
+    await coordinator.async_shutdown()
+    await hass.async_block_till_done()
+
+    assert hass_storage[key]["data"] == {"sky_calibration_factor": 0.9}
+
+
+# ── Forecast reuse ────────────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize(
+    ("field", "before", "after", "attr"),
+    [
+        ("wind_speed", 0.96, 1.04, "wind_dir"),
+        ("cloud_cover", 19.96, 20.04, "cloud_level"),
+    ],
+)
+async def test_forecast_recomputed_across_threshold(
+    hass: HomeAssistant,
+    field: str,
+    before: float,
+    after: float,
+    attr: str,
+) -> None:
+    """Test that a reading crossing a classification threshold is not reused."""
+    coordinator = _make_coordinator(hass)
+    sensor_data: dict[str, Any] = {
+        "pressure": 1020.0,
+        "wind_direction": 270.0,
+        "wind_speed": 15.0,
+        "cloud_cover": 10.0,
+        "raining": False,
+        "temperature": 18.0,
+        "pressure_change": 0.5,
+        "wind_historic": 270.0,
+    }
+
+    first, _ = coordinator._compute_forecast({**sensor_data, field: before})
+    first_value = getattr(first, attr)
+    second, _ = coordinator._compute_forecast({**sensor_data, field: after})
+
+    assert getattr(second, attr) != first_value
+
+
+# ── External weather fetch ────────────────────────────────────────────────────
+
+
+async def test_failed_background_fetch_backs_off(hass: HomeAssistant) -> None:
+    """Test that an unavailable weather entity is not refetched on every tick."""
+    coordinator = _make_coordinator(
+        hass, options={CONF_WEATHER_ENTITY: MOCK_WEATHER_ENTITY}
+    )
+    coordinator._ext_weather_data = ExternalWeatherData()
+    get_data = AsyncMock(return_value=None)
+
+    with patch.object(coordinator._ext_weather_client, "async_get_data", get_data):
+        coordinator._async_schedule_external_weather_fetch()
+        await hass.async_block_till_done()
+        coordinator._async_schedule_external_weather_fetch()
+        await hass.async_block_till_done()
+
+    assert get_data.await_count == 1
+
+
+async def test_background_fetch_error_backs_off(hass: HomeAssistant) -> None:
+    """Test that an error escaping the weather integration still backs off."""
+    coordinator = _make_coordinator(
+        hass, options={CONF_WEATHER_ENTITY: MOCK_WEATHER_ENTITY}
+    )
+    coordinator._ext_weather_data = ExternalWeatherData()
+    get_data = AsyncMock(side_effect=RuntimeError("boom"))
+
+    with patch.object(coordinator._ext_weather_client, "async_get_data", get_data):
+        coordinator._async_schedule_external_weather_fetch()
+        await hass.async_block_till_done()
+        coordinator._async_schedule_external_weather_fetch()
+        await hass.async_block_till_done()
+
+    assert get_data.await_count == 1
+    assert coordinator._ext_weather_failures == 1
+
+
+async def test_external_fetch_backoff_grows_and_resets(hass: HomeAssistant) -> None:
+    """Test that retries double up to the fetch interval and reset on success."""
+    coordinator = _make_coordinator(
+        hass, options={CONF_WEATHER_ENTITY: MOCK_WEATHER_ENTITY}
+    )
+    get_data = AsyncMock(return_value=None)
+    delays: list[float] = []
+
+    with (
+        patch.object(coordinator._ext_weather_client, "async_get_data", get_data),
+        patch(
+            "custom_components.sager_weathercaster.coordinator.time.monotonic",
+            return_value=1000.0,
+        ),
+    ):
+        for _ in range(3):
+            coordinator._ext_weather_next_fetch = 0.0
+            await coordinator._async_fetch_external_weather()
+            delays.append(coordinator._ext_weather_next_fetch - 1000.0)
+
+        get_data.return_value = ExternalWeatherData()
+        coordinator._ext_weather_next_fetch = 0.0
+        await coordinator._async_fetch_external_weather()
+
+    assert delays == [600.0, 1200.0, 1800.0]
+    assert coordinator._ext_weather_failures == 0
+    assert coordinator._ext_weather_next_fetch == 1000.0 + 1800.0
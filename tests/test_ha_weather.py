@@ -0,0 +1,80 @@
+"""Tests for the Sager Weathercaster HA weather entity adapter."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from homeassistant.components.weather import WeatherEntityFeature
+from homeassistant.core import HomeAssistant
+
+from custom_components.sager_weathercaster.ha_weather import HAWeatherClient
+
+MOCK_WEATHER_ENTITY = "weather.mock_weather"
+
+
+async def _requested_types(client: HAWeatherClient) -> set[str]:
+    """Run one fetch and return the forecast types requested from the entity."""
+    get_list = AsyncMock(return_value=[])
+    with patch.object(client, "_async_get_forecast_list", get_list):
+        assert await client.async_get_data() is not None
+    return {call.args[0] for call in get_list.await_args_list}
+
+
+async def test_plan_follows_supported_features(hass: HomeAssistant) -> None:
+    """Test that a supported_features change is honoured without unavailability."""
+    client = HAWeatherClient(hass, MOCK_WEATHER_ENTITY)
+
+    hass.states.async_set(
+        MOCK_WEATHER_ENTITY,
+        "sunny",
+        {"supported_features": WeatherEntityFeature.FORECAST_DAILY},
+    )
+    assert await _requested_types(client) == {"daily"}
+
+    hass.states.async_set(
+        MOCK_WEATHER_ENTITY,
+        "sunny",
+        {
+            "supported_features": WeatherEntityFeature.FORECAST_HOURLY
+            | WeatherEntityFeature.FORECAST_DAILY
+        },
+    )
+    assert await _requested_types(client) == {"hourly", "daily"}
+
+
+async def test_unavailable_entity_returns_none(hass: HomeAssistant) -> None:
+    """Test that an unavailable entity yields no data and no service calls."""
+    client = HAWeatherClient(hass, MOCK_WEATHER_ENTITY)
+    hass.states.async_set(MOCK_WEATHER_ENTITY, "unavailable")
+
+    get_list = AsyncMock(return_value=[])
+    with patch.object(client, "_async_get_forecast_list", get_list):
+        assert await client.async_get_data() is None
+    get_list.assert_not_awaited()
+
+
+async def test_escaping_fetch_error_is_not_grouped(hass: HomeAssistant) -> None:
+    """Test that an error escaping one fetch is raised as-is after both finish."""
+    client = HAWeatherClient(hass, MOCK_WEATHER_ENTITY)
+    hass.states.async_set(
+        MOCK_WEATHER_ENTITY,
+        "sunny",
+        {
+            "supported_features": WeatherEntityFeature.FORECAST_HOURLY
+            | WeatherEntityFeature.FORECAST_DAILY
+        },
+    )
+
+    fetch_hourly = AsyncMock(return_value=[])
+    with (
+        patch.object(client, "_fetch_forecast", fetch_hourly),
+        patch.object(
+            client, "_fetch_daily", AsyncMock(side_effect=RuntimeError("boom"))
+        ),
+        pytest.raises(RuntimeError, match="boom"),
+    ):
+        await client.async_get_data()
+
+    fetch_hourly.assert_awaited_once_with("hourly")